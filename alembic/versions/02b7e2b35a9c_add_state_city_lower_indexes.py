@@ -0,0 +1,30 @@
+"""add lower(state_province) and lower(city) indexes to devotees
+
+Revision ID: 02b7e2b35a9c
+Revises: b5a60f505940
+Create Date: 2026-10-17 19:42:08.117364
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '02b7e2b35a9c'
+down_revision = 'b5a60f505940'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Index the lowercased state and city filters when used without a country."""
+    op.create_index('ix_devotees_state_lower', 'devotees',
+                    [sa.text('(lower(state_province))')], unique=False)
+    op.create_index('ix_devotees_city_lower', 'devotees',
+                    [sa.text('(lower(city))')], unique=False)
+
+
+def downgrade() -> None:
+    """Rollback: drop the lowercased state and city indexes."""
+    op.drop_index('ix_devotees_city_lower', table_name='devotees')
+    op.drop_index('ix_devotees_state_lower', table_name='devotees')
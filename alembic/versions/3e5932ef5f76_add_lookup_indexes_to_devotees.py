@@ -0,0 +1,40 @@
+"""add lookup indexes to devotees
+
+Revision ID: 3e5932ef5f76
+Revises: d07ff843a007
+Create Date: 2026-10-17 15:31:46.204117
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '3e5932ef5f76'
+down_revision = 'd07ff843a007'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Index token lookups, created_at and the case-insensitive filters."""
+    op.create_index(op.f('ix_devotees_verification_token'), 'devotees',
+                    ['verification_token'], unique=False)
+    op.create_index(op.f('ix_devotees_password_reset_token'), 'devotees',
+                    ['password_reset_token'], unique=False)
+    op.create_index(op.f('ix_devotees_created_at'), 'devotees', ['created_at'], unique=False)
+    # Functional key parts (MySQL 8.0.13+) matching LOWER(col) = :value filters
+    op.create_index('ix_devotees_location_lower', 'devotees',
+                    [sa.text('(lower(country))'), sa.text('(lower(state_province))'),
+                     sa.text('(lower(city))')], unique=False)
+    op.create_index('ix_devotees_spiritual_master_lower', 'devotees',
+                    [sa.text('(lower(spiritual_master))')], unique=False)
+
+
+def downgrade() -> None:
+    """Rollback: drop the lookup indexes."""
+    op.drop_index('ix_devotees_spiritual_master_lower', table_name='devotees')
+    op.drop_index('ix_devotees_location_lower', table_name='devotees')
+    op.drop_index(op.f('ix_devotees_created_at'), table_name='devotees')
+    op.drop_index(op.f('ix_devotees_password_reset_token'), table_name='devotees')
+    op.drop_index(op.f('ix_devotees_verification_token'), table_name='devotees')
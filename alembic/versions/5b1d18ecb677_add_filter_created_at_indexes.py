@@ -0,0 +1,33 @@
+"""add filter + created_at composite indexes to devotees
+
+Revision ID: 5b1d18ecb677
+Revises: f82f688f6522
+Create Date: 2026-10-17 18:05:13.402981
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '5b1d18ecb677'
+down_revision = 'f82f688f6522'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Index the common list filters together with the default created_at sort."""
+    op.create_index('ix_devotees_country_lower_created', 'devotees',
+                    [sa.text('(lower(country))'), 'created_at'], unique=False)
+    op.create_index('ix_devotees_initiation_created', 'devotees',
+                    ['initiation_status', 'created_at'], unique=False)
+    op.create_index('ix_devotees_gender_created', 'devotees',
+                    ['gender', 'created_at'], unique=False)
+
+
+def downgrade() -> None:
+    """Rollback: drop the composite list indexes."""
+    op.drop_index('ix_devotees_gender_created', table_name='devotees')
+    op.drop_index('ix_devotees_initiation_created', table_name='devotees')
+    op.drop_index('ix_devotees_country_lower_created', table_name='devotees')
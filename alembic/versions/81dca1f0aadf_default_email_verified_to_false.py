@@ -0,0 +1,33 @@
+"""default email_verified to false
+
+Revision ID: 81dca1f0aadf
+Revises: ec8bf4f69aeb
+Create Date: 2026-10-17 09:40:12.503917
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '81dca1f0aadf'
+down_revision = 'ec8bf4f69aeb'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Backfill NULL email_verified and add a FALSE server default."""
+    op.execute('UPDATE devotees SET email_verified = FALSE WHERE email_verified IS NULL')
+    op.alter_column('devotees', 'email_verified',
+                    existing_type=sa.Boolean(),
+                    nullable=False,
+                    server_default=sa.false())
+
+
+def downgrade() -> None:
+    """Rollback: drop the server default."""
+    op.alter_column('devotees', 'email_verified',
+                    existing_type=sa.Boolean(),
+                    nullable=False,
+                    server_default=None)
@@ -0,0 +1,27 @@
+"""add fulltext index for devotee search
+
+Revision ID: 9f35c80ed5c1
+Revises: 3e5932ef5f76
+Create Date: 2026-10-17 15:44:20.661893
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = '9f35c80ed5c1'
+down_revision = '3e5932ef5f76'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Add a FULLTEXT index over the text-searched devotee columns."""
+    op.create_index('ix_devotees_fts', 'devotees',
+                    ['legal_name', 'email', 'city', 'country', 'spiritual_master'],
+                    unique=False, mysql_prefix='FULLTEXT')
+
+
+def downgrade() -> None:
+    """Rollback: drop the FULLTEXT index."""
+    op.drop_index('ix_devotees_fts', table_name='devotees')
@@ -0,0 +1,50 @@
+"""store devotee children as a plain list
+
+Revision ID: b5a60f505940
+Revises: 5b1d18ecb677
+Create Date: 2026-10-17 18:41:27.930114
+
+"""
+import json
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'b5a60f505940'
+down_revision = '5b1d18ecb677'
+branch_labels = None
+depends_on = None
+
+
+def _rewrite_children(convert) -> None:
+    """Apply convert to every stored children value."""
+    bind = op.get_bind()
+    rows = bind.execute(sa.text(
+        'SELECT id, children FROM devotees WHERE children IS NOT NULL'
+    )).fetchall()
+    for devotee_id, children in rows:
+        if isinstance(children, str):
+            children = json.loads(children)
+        converted = convert(children)
+        if converted is not children:
+            bind.execute(
+                sa.text('UPDATE devotees SET children = :children WHERE id = :id'),
+                {'children': json.dumps(converted), 'id': devotee_id},
+            )
+
+
+def upgrade() -> None:
+    """Unwrap {"count", "children", "updated_at"} objects into the bare children list."""
+    _rewrite_children(
+        lambda children: children.get('children', []) if isinstance(children, dict) else children
+    )
+
+
+def downgrade() -> None:
+    """Rollback: wrap children lists back into the counted object format."""
+    _rewrite_children(
+        lambda children: {'count': len(children), 'children': children, 'updated_at': None}
+        if isinstance(children, list) else children
+    )
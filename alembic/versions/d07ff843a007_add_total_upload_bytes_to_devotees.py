@@ -0,0 +1,43 @@
+"""add total_upload_bytes to devotees
+
+Revision ID: d07ff843a007
+Revises: 81dca1f0aadf
+Create Date: 2026-10-17 14:52:08.118204
+
+"""
+import json
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'd07ff843a007'
+down_revision = '81dca1f0aadf'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Add a running total of uploaded file sizes and backfill it."""
+    op.add_column('devotees', sa.Column('total_upload_bytes', sa.BigInteger(),
+                                        nullable=False, server_default='0'))
+
+    bind = op.get_bind()
+    rows = bind.execute(sa.text(
+        'SELECT id, uploaded_files FROM devotees WHERE uploaded_files IS NOT NULL'
+    )).fetchall()
+    for devotee_id, uploaded_files in rows:
+        if isinstance(uploaded_files, str):
+            uploaded_files = json.loads(uploaded_files)
+        total = sum(file_info.get('size', 0) for file_info in uploaded_files or [])
+        if total:
+            bind.execute(
+                sa.text('UPDATE devotees SET total_upload_bytes = :total WHERE id = :id'),
+                {'total': total, 'id': devotee_id},
+            )
+
+
+def downgrade() -> None:
+    """Rollback: drop total_upload_bytes."""
+    op.drop_column('devotees', 'total_upload_bytes')
@@ -0,0 +1,37 @@
+"""add covering index for devotee name search
+
+Revision ID: ec8bf4f69aeb
+Revises: a4da34a45d76
+Create Date: 2026-10-17 09:12:41.118204
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = 'ec8bf4f69aeb'
+down_revision = 'a4da34a45d76'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Replace idx_name_search with a covering (legal_name, ...) index.
+
+    MySQL has no INCLUDE clause, so the covered columns are trailing key
+    parts; InnoDB appends the primary key to every secondary index, so id
+    is covered implicitly. ORDER BY legal_name LIMIT n can walk this index
+    in order and stop early instead of sorting every match.
+    """
+    op.create_index(
+        'ix_devotees_legal_name_cover',
+        'devotees',
+        ['legal_name', 'email', 'country', 'initiation_status'],
+    )
+    op.drop_index('idx_name_search', table_name='devotees')
+
+
+def downgrade() -> None:
+    """Restore the single-column name index."""
+    op.create_index('idx_name_search', 'devotees', ['legal_name'])
+    op.drop_index('ix_devotees_legal_name_cover', table_name='devotees')
@@ -0,0 +1,63 @@
+"""hash devotee verification and reset tokens
+
+Revision ID: f82f688f6522
+Revises: 9f35c80ed5c1
+Create Date: 2026-10-17 17:12:40.518372
+
+"""
+import hashlib
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'f82f688f6522'
+down_revision = '9f35c80ed5c1'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Replace plaintext tokens with their SHA-256 digests."""
+    op.add_column('devotees', sa.Column('verification_token_hash', sa.BINARY(length=32),
+                                        nullable=True))
+    op.add_column('devotees', sa.Column('password_reset_token_hash', sa.BINARY(length=32),
+                                        nullable=True))
+
+    # Hash outstanding tokens so links already emailed keep working
+    bind = op.get_bind()
+    for column in ('verification_token', 'password_reset_token'):
+        rows = bind.execute(sa.text(
+            f'SELECT id, {column} FROM devotees WHERE {column} IS NOT NULL'
+        )).fetchall()
+        for devotee_id, token in rows:
+            bind.execute(
+                sa.text(f'UPDATE devotees SET {column}_hash = :digest WHERE id = :id'),
+                {'digest': hashlib.sha256(token.encode()).digest(), 'id': devotee_id},
+            )
+
+    op.create_index(op.f('ix_devotees_verification_token_hash'), 'devotees',
+                    ['verification_token_hash'], unique=False)
+    op.create_index(op.f('ix_devotees_password_reset_token_hash'), 'devotees',
+                    ['password_reset_token_hash'], unique=False)
+    op.drop_index(op.f('ix_devotees_password_reset_token'), table_name='devotees')
+    op.drop_index(op.f('ix_devotees_verification_token'), table_name='devotees')
+    op.drop_column('devotees', 'password_reset_token')
+    op.drop_column('devotees', 'verification_token')
+
+
+def downgrade() -> None:
+    """Rollback: restore plaintext token columns; outstanding tokens are invalidated."""
+    op.add_column('devotees', sa.Column('verification_token', sa.String(length=255),
+                                        nullable=True))
+    op.add_column('devotees', sa.Column('password_reset_token', sa.String(length=255),
+                                        nullable=True))
+    op.create_index(op.f('ix_devotees_verification_token'), 'devotees',
+                    ['verification_token'], unique=False)
+    op.create_index(op.f('ix_devotees_password_reset_token'), 'devotees',
+                    ['password_reset_token'], unique=False)
+    op.drop_index(op.f('ix_devotees_password_reset_token_hash'), table_name='devotees')
+    op.drop_index(op.f('ix_devotees_verification_token_hash'), table_name='devotees')
+    op.drop_column('devotees', 'password_reset_token_hash')
+    op.drop_column('devotees', 'verification_token_hash')
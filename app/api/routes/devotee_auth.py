@@ -11,6 +11,7 @@ from typing import Annotated
 
 from fastapi import (
     APIRouter,
+    BackgroundTasks,
     Depends,
     File,
     Form,
@@ -356,6 +357,7 @@ Register a new devotee with simplified signup process.
 async def devotee_signup(
     request: Request,
     devotee_data: DevoteeSimpleCreate,
+    background_tasks: BackgroundTasks,
     db: Session = Depends(get_db),
 ):
     """
@@ -380,7 +382,9 @@ async def devotee_signup(
         )
 
         service = DevoteeService(db)
-        devotee = await service.create_simple_unverified_devotee(validated_devotee_data)
+        devotee = await service.create_simple_unverified_devotee(
+            validated_devotee_data, background_tasks
+        )
 
         logger.info(f"Simplified devotee signup successful for email: {email}")
         return JSONResponse(
@@ -928,6 +932,7 @@ async def complete_devotee_profile(
             if profile_photo and hasattr(profile_photo, "filename") and profile_photo.filename
             else None,
             uploaded_files=uploaded_documents if uploaded_documents else None,
+            devotee=current_devotee,
         )
 
         files_count = (
@@ -1139,7 +1144,7 @@ async def devotee_login(
         service = DevoteeService(db)
 
         # Authenticate devotee (returns None if invalid credentials)
-        devotee = service.authenticate_devotee(email, login_data.password)
+        devotee = await service.authenticate_devotee(email, login_data.password)
         if not devotee:
             # Use generic error message to prevent email enumeration
             logger.warning(f"Failed login attempt for email: {email}")
@@ -1448,6 +1453,7 @@ Verify devotee's email address using the verification token sent via email.
 async def verify_devotee_email(
     request_obj: Request,
     request: EmailVerificationRequest,
+    background_tasks: BackgroundTasks,
     db: Session = Depends(get_db),
 ):
     """
@@ -1472,7 +1478,7 @@ async def verify_devotee_email(
             )
 
         service = DevoteeService(db)
-        verified_email = await service.verify_devotee_email(request.token)
+        verified_email = await service.verify_devotee_email(request.token, background_tasks)
 
         logger.info(f"Email verification successful for: {verified_email}")
         return JSONResponse(
@@ -1639,6 +1645,7 @@ Resend email verification link to a devotee.
 async def resend_devotee_verification(
     request_obj: Request,
     request: ResendVerificationRequest,
+    background_tasks: BackgroundTasks,
     db: Session = Depends(get_db),
 ):
     """
@@ -1650,8 +1657,11 @@ async def resend_devotee_verification(
         # Validate and sanitize email
         email = input_validator.validate_email(request.email)
 
+        # One resend per address per minute
+        auth_security.check_email_send_cooldown(email, "verification")
+
         service = DevoteeService(db)
-        success = await service.resend_verification_email(email)
+        success = await service.resend_verification_email(email, background_tasks)
 
         if not success:
             return JSONResponse(
@@ -1664,6 +1674,7 @@ async def resend_devotee_verification(
                 ).model_dump(),
             )
 
+        auth_security.record_email_sent(email, "verification")
         logger.info(f"Verification email resent to: {email}")
         return JSONResponse(
             status_code=status.HTTP_200_OK,
@@ -1895,6 +1906,7 @@ Request a password reset link via email.
 async def devotee_forgot_password(
     request_obj: Request,
     request: ForgotPasswordRequest,
+    background_tasks: BackgroundTasks,
     db: Session = Depends(get_db),
 ):
     """
@@ -1908,9 +1920,11 @@ async def devotee_forgot_password(
 
         # Apply rate limiting for password reset requests
         auth_security.check_password_reset_rate_limit(request_obj, email)
+        auth_security.check_email_send_cooldown(email, "password_reset")
 
         service = DevoteeService(db)
-        await service.send_password_reset_email(email)
+        await service.send_password_reset_email(email, background_tasks)
+        auth_security.record_email_sent(email, "password_reset")
 
         logger.info("Password reset email process completed")
         return JSONResponse(
@@ -1931,7 +1945,9 @@ async def devotee_forgot_password(
         # Intelligently add data based on error type
         response_data = None
         if e.status_code == status.HTTP_429_TOO_MANY_REQUESTS:
-            response_data = {"retry_after_seconds": 900}
+            # The email cooldown reports its own wait; otherwise the 15-minute window
+            retry_after = (e.headers or {}).get("Retry-After", 900)
+            response_data = {"retry_after_seconds": int(retry_after)}
 
         return JSONResponse(
             status_code=e.status_code,
@@ -2213,7 +2229,7 @@ async def devotee_reset_password(
         new_password = input_validator.validate_password(request.new_password)
 
         service = DevoteeService(db)
-        success = service.reset_password_with_token(request.token, new_password)
+        success = await service.reset_password_with_token(request.token, new_password)
 
         if not success:
             return JSONResponse(
@@ -2485,7 +2501,7 @@ async def admin_reset_devotee_password(
         new_password = input_validator.validate_password(request.new_password)
 
         service = DevoteeService(db)
-        success = service.admin_reset_password(request.devotee_id, new_password, admin.id)
+        success = await service.admin_reset_password(request.devotee_id, new_password, admin.id)
 
         if not success:
             return JSONResponse(
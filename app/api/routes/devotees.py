@@ -6,11 +6,17 @@ advanced search, filtering, statistics, and profile management.
 Optimized for performance with 100K users.
 """
 
+import asyncio
+import csv
+import io
 import logging
+from collections.abc import Iterator
+from enum import Enum
 from pathlib import Path
 
 from fastapi import (
     APIRouter,
+    Body,
     Depends,
     File,
     Form,
@@ -19,7 +25,8 @@ from fastapi import (
     UploadFile,
     status,
 )
-from fastapi.responses import Response
+from fastapi.responses import StreamingResponse
+from sqlalchemy import update
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.orm import Session
 
@@ -30,6 +37,7 @@ from app.db.session import get_db
 from app.schemas.devotee import (
     DevoteeCreate,
     DevoteeSearchFilters,
+    DevoteeSummary,
     DevoteeUpdate,
 )
 from app.schemas.devotee_responses import (
@@ -42,12 +50,15 @@ from app.schemas.devotee_responses import (
 
 # NOTE: Using service class directly with per-request instantiation
 from app.services.devotee_service import DevoteeService
-from app.services.storage_service import StorageService
+from app.services.storage_service import get_storage_service
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/devotees", tags=["Devotees"])
 
+# Most devotees accepted by one bulk create request
+_BULK_CREATE_LIMIT = 500
+
 
 @router.get(
     "/",
@@ -88,6 +99,11 @@ async def get_devotees(
     # Pagination
     page: int = Query(1, ge=1, description="Page number"),
     limit: int = Query(50, ge=1, le=100, description="Items per page"),
+    cursor: str | None = Query(
+        None,
+        max_length=200,
+        description="next_cursor from the previous page; pages by created_at instead of page",
+    ),
     # Sorting
     sort_by: str | None = Query(
         "created_at",
@@ -140,6 +156,7 @@ async def get_devotees(
             max_rounds=max_rounds,
             page=page,
             limit=limit,
+            cursor=cursor,
             sort_by=sort_by,
             sort_order=sort_order,
         )
@@ -170,7 +187,7 @@ async def get_devotees(
 
 
 @router.post("/", response_model=StandardDevoteeResponse, summary="Create New Devotee")
-async def create_devotee(
+def create_devotee(
     devotee_data: DevoteeCreate,
     db: Session = Depends(get_db),
     admin: Devotee = Depends(require_admin),
@@ -204,6 +221,8 @@ async def create_devotee(
     - SQL injection prevention
     - Input sanitization
     """
+    # Plain def: FastAPI runs this in its threadpool, so password hashing and
+    # the INSERT don't block the event loop
     try:
         service = DevoteeService(db)
         devotee = service.create_devotee(db, devotee_data)
@@ -230,6 +249,57 @@ async def create_devotee(
         )
 
 
+@router.post(
+    "/bulk",
+    status_code=status.HTTP_201_CREATED,
+    summary="Bulk Create Devotees",
+    description=f"""
+Create up to {_BULK_CREATE_LIMIT} devotees in a single request (admin imports).
+
+**Access Control:**
+- Admin users only
+
+**Behaviour:**
+- Every row is validated like a single devotee creation
+- The batch is all-or-nothing: if any email is already registered, or repeated
+  within the batch, nothing is created
+    """,
+)
+def bulk_create_devotees(
+    devotees: list[DevoteeCreate] = Body(..., min_length=1, max_length=_BULK_CREATE_LIMIT),
+    db: Session = Depends(get_db),
+    admin: Devotee = Depends(require_admin),
+):
+    """
+    Create many devotees in one multi-row INSERT.
+
+    Args:
+        devotees: Devotee creation data, one entry per devotee
+        db: Database session
+        admin: Current admin user
+
+    Returns:
+        dict: Number of devotees created
+
+    Raises:
+        HTTPException: For duplicate emails or validation errors
+    """
+    # Plain def, like create_devotee: the hashing and INSERT run in the threadpool
+    try:
+        created = DevoteeService(db).bulk_create_devotees(db, devotees)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+    logger.info(f"Admin {admin.id} bulk created {created} devotees")
+
+    return {
+        "success": True,
+        "status_code": 201,
+        "message": f"Created {created} devotee(s)",
+        "data": {"created": created},
+    }
+
+
 @router.get("/{devotee_id}", response_model=StandardDevoteeResponse, summary="Get Devotee by ID")
 async def get_devotee(
     devotee_id: int,
@@ -404,7 +474,7 @@ async def search_devotees_text(
             success=True,
             status_code=status.HTTP_200_OK,
             message="Search completed successfully",
-            data=devotees,
+            data={"results": devotees, "count": len(devotees)},
         )
 
     except HTTPException:
@@ -426,6 +496,10 @@ async def get_devotees_by_location(
     country: str,
     state: str | None = Query(None, description="State or province"),
     city: str | None = Query(None, description="City name"),
+    limit: int = Query(100, ge=1, le=1000, description="Maximum results per page"),
+    after_id: int | None = Query(
+        None, ge=1, description="Cursor: next_cursor value from the previous page"
+    ),
     db: Session = Depends(get_db),
     admin: Devotee = Depends(require_admin),
 ):
@@ -446,12 +520,14 @@ async def get_devotees_by_location(
     **Performance Features:**
     - Indexed location queries
     - Hierarchical filtering
-    - Efficient sorting by name
+    - Keyset pagination: pass `next_cursor` back as `after_id` for the next page
     """
     try:
         service = DevoteeService(db)
 
-        devotees = service.get_devotees_by_location(db, country, state, city)
+        devotees, next_cursor = service.get_devotees_by_location(
+            db, country, state, city, limit=limit, after_id=after_id
+        )
 
         location_desc = f"{city}, " if city else ""
         location_desc += f"{state}, " if state else ""
@@ -462,7 +538,11 @@ async def get_devotees_by_location(
             success=True,
             status_code=status.HTTP_200_OK,
             message="Devotees retrieved successfully",
-            data=devotees,
+            data={
+                "results": [DevoteeSummary.model_validate(d) for d in devotees],
+                "count": len(devotees),
+                "next_cursor": next_cursor,
+            },
         )
 
     except SQLAlchemyError:
@@ -480,6 +560,10 @@ async def get_devotees_by_location(
 )
 async def get_devotees_by_spiritual_master(
     master_name: str,
+    limit: int = Query(100, ge=1, le=1000, description="Maximum results per page"),
+    after_id: int | None = Query(
+        None, ge=1, description="Cursor: next_cursor value from the previous page"
+    ),
     db: Session = Depends(get_db),
     admin: Devotee = Depends(require_admin),
 ):
@@ -488,7 +572,7 @@ async def get_devotees_by_spiritual_master(
 
     **Features:**
     - Case-insensitive spiritual master search
-    - Sorted results by devotee name
+    - Keyset pagination: pass `next_cursor` back as `after_id` for the next page
     - Includes initiation details
 
     **Use Cases:**
@@ -500,9 +584,20 @@ async def get_devotees_by_spiritual_master(
     try:
         service = DevoteeService(db)
 
-        devotees = service.get_devotees_by_spiritual_master(db, master_name)
+        devotees, next_cursor = service.get_devotees_by_spiritual_master(
+            db, master_name, limit=limit, after_id=after_id
+        )
         logger.info(f"Retrieved {len(devotees)} devotees of spiritual master: {master_name}")
-        return devotees
+        return StandardSearchResponse(
+            success=True,
+            status_code=status.HTTP_200_OK,
+            message="Devotees retrieved successfully",
+            data={
+                "results": [DevoteeSummary.model_validate(d) for d in devotees],
+                "count": len(devotees),
+                "next_cursor": next_cursor,
+            },
+        )
 
     except SQLAlchemyError:
         logger.exception("Error retrieving devotees by spiritual master")
@@ -616,8 +711,30 @@ async def get_devotee_photo(
 # Additional utility endpoints
 
 
+# Columns written by the CSV export, in order
+_EXPORT_FIELDS = (
+    "id",
+    "legal_name",
+    "email",
+    "country_code",
+    "mobile_number",
+    "gender",
+    "date_of_birth",
+    "city",
+    "state_province",
+    "country",
+    "initiation_status",
+    "spiritual_master",
+    "chanting_number_of_rounds",
+    "created_at",
+)
+
+
 @router.get("/export/csv", summary="Export Devotees to CSV")
 async def export_devotees_csv(
+    country: str | None = Query(None, description="Country filter"),
+    state: str | None = Query(None, description="State or province filter"),
+    city: str | None = Query(None, description="City filter"),
     db: Session = Depends(get_db),
     admin: Devotee = Depends(require_admin),
 ):
@@ -637,13 +754,37 @@ async def export_devotees_csv(
     **Data Handling:**
     - Sanitized data for privacy
     - Proper CSV encoding
-    - Compressed download for large datasets
+    - Rows are streamed in batches, so memory use does not grow with the export size
     """
-    # TODO: Implement CSV export functionality
-    raise HTTPException(
-        status_code=status.HTTP_501_NOT_IMPLEMENTED,
-        detail="CSV export feature coming soon",
+    service = DevoteeService(db)
+    devotees = service.iter_devotees_by_location(db, country, state, city)
+
+    logger.info(
+        f"Admin {admin.id} exported devotees (country={country}, state={state}, city={city})"
     )
+    return StreamingResponse(
+        _csv_lines(devotees),
+        media_type="text/csv",
+        headers={"Content-Disposition": 'attachment; filename="devotees.csv"'},
+    )
+
+
+def _csv_lines(devotees) -> Iterator[str]:
+    """Render devotees as CSV, one line at a time, header first."""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(_EXPORT_FIELDS)
+    for devotee in devotees:
+        writer.writerow(
+            [
+                value.name if isinstance(value, Enum) else ("" if value is None else value)
+                for value in (getattr(devotee, field) for field in _EXPORT_FIELDS)
+            ]
+        )
+        yield buffer.getvalue()
+        buffer.seek(0)
+        buffer.truncate()
+    yield buffer.getvalue()
 
 
 @router.get(
@@ -732,7 +873,7 @@ async def download_devotee_file(
         db: Database session
 
     Returns:
-        Response: The requested file with appropriate content type
+        StreamingResponse: The requested file with appropriate content type
 
     Raises:
         HTTPException: For access denied or file not found
@@ -741,14 +882,16 @@ async def download_devotee_file(
     check_resource_access(current_user, devotee_id, "file")
 
     # Download from GCS
-    storage_service = StorageService()
-    content, content_type = storage_service.download_file(devotee_id, filename)
+    storage_service = get_storage_service()
+    content, content_type = await asyncio.to_thread(
+        storage_service.download_file, devotee_id, filename
+    )
 
     logger.info(f"User {current_user.id} downloaded file: {devotee_id}/{filename}")
 
     # Return file as streaming response
-    return Response(
-        content=content,
+    return StreamingResponse(
+        content,
         media_type=content_type,
         headers={"Content-Disposition": f'attachment; filename="{filename}"'},
     )
@@ -808,8 +951,34 @@ async def upload_devotee_files(
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Devotee not found")
 
     # Upload file to GCS
-    storage_service = StorageService()
-    file_metadata = storage_service.upload_file(file=file, user_id=devotee_id, file_purpose=purpose)
+    storage_service = get_storage_service()
+    file_metadata = await storage_service.upload_file_async(
+        file=file, user_id=devotee_id, file_purpose=purpose
+    )
+
+    # Record the file on the devotee so the file list and byte total stay in step
+    if Path(file_metadata["gcs_path"]).stem == "profile_photo":
+        devotee.profile_photo_path = file_metadata["gcs_path"]
+    else:
+        # Re-read under a row lock: the upload ran outside any transaction
+        existing_files = (
+            db.query(Devotee.uploaded_files)
+            .filter(Devotee.id == devotee_id)
+            .with_for_update()
+            .scalar()
+        ) or []
+        # Files are named after their purpose, so a repeat upload replaces the entry
+        replaced = [f for f in existing_files if f.get("gcs_path") == file_metadata["gcs_path"]]
+        size_delta = file_metadata["size"] - sum(f.get("size", 0) for f in replaced)
+        db.execute(
+            update(Devotee)
+            .where(Devotee.id == devotee_id)
+            .values(
+                uploaded_files=[f for f in existing_files if f not in replaced] + [file_metadata],
+                total_upload_bytes=Devotee.total_upload_bytes + size_delta,
+            )
+        )
+    db.commit()
 
     logger.info(f"User {current_user.id} uploaded file '{purpose}' for devotee {devotee_id}")
 
@@ -858,8 +1027,8 @@ async def list_devotee_files(
     check_resource_access(current_user, devotee_id, "file")
 
     # List files from GCS
-    storage_service = StorageService()
-    files = storage_service.list_user_files(devotee_id)
+    storage_service = get_storage_service()
+    files = await asyncio.to_thread(storage_service.list_user_files, devotee_id)
 
     logger.info(f"User {current_user.id} listed {len(files)} files for devotee {devotee_id}")
 
@@ -916,23 +1085,25 @@ async def update_devotee_file(
     # Check access: admin or owner
     check_resource_access(current_user, devotee_id, "file")
 
-    storage_service = StorageService()
+    storage_service = get_storage_service()
 
     # Check if file exists
-    if not storage_service.file_exists(devotee_id, filename):
+    if not await asyncio.to_thread(storage_service.file_exists, devotee_id, filename):
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="File not found",
         )
 
     # Delete old file
-    storage_service.delete_file(devotee_id, filename)
+    await asyncio.to_thread(storage_service.delete_file, devotee_id, filename)
 
     # Extract purpose from filename (remove extension)
     purpose = Path(filename).stem
 
     # Upload new file with same purpose
-    file_metadata = storage_service.upload_file(file=file, user_id=devotee_id, file_purpose=purpose)
+    file_metadata = await storage_service.upload_file_async(
+        file=file, user_id=devotee_id, file_purpose=purpose
+    )
 
     # Update database metadata
     devotee = db.query(Devotee).filter(Devotee.id == devotee_id).first()
@@ -945,14 +1116,22 @@ async def update_devotee_file(
         if devotee.uploaded_files:
             # Find and update the file metadata in the array
             updated_files = []
+            size_delta = 0
             for existing_file in devotee.uploaded_files:  # type: ignore[attr-defined]
                 if existing_file.get("name") == filename or existing_file.get(
                     "gcs_path", ""
                 ).endswith(filename):
                     updated_files.append(file_metadata)
+                    size_delta += file_metadata["size"] - existing_file.get("size", 0)
                 else:
                     updated_files.append(existing_file)
             devotee.uploaded_files = updated_files  # type: ignore[assignment]
+            if size_delta:
+                db.execute(
+                    update(Devotee)
+                    .where(Devotee.id == devotee.id)
+                    .values(total_upload_bytes=Devotee.total_upload_bytes + size_delta)
+                )
 
         db.commit()
 
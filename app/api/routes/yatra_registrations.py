@@ -463,10 +463,10 @@ def get_payment_screenshots(
     db: Session = Depends(get_db),
 ):
     """Get all payment screenshots for a registration, or download a specific file."""
-    from fastapi.responses import Response
+    from fastapi.responses import StreamingResponse
 
     from app.db.models import UserRole
-    from app.services.storage_service import StorageService
+    from app.services.storage_service import get_storage_service
 
     try:
         service = YatraRegistrationService(db)
@@ -498,7 +498,7 @@ def get_payment_screenshots(
                 )
 
             # Download the file from GCS
-            storage_service = StorageService()
+            storage_service = get_storage_service()
             # Extract user_id and full path from gcs_path (format: {user_id}/{group_id}/{uuid}.{ext})
             gcs_path_parts = matching_file["gcs_path"].split("/", 1)
             if len(gcs_path_parts) != 2:
@@ -522,8 +522,8 @@ def get_payment_screenshots(
             )
 
             # Return file as streaming response
-            return Response(
-                content=content,
+            return StreamingResponse(
+                content,
                 media_type=content_type,
                 headers={"Content-Disposition": f'attachment; filename="{matching_file["name"]}"'},
             )
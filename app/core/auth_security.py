@@ -7,6 +7,7 @@ authentication including rate limiting, input validation, and secure error handl
 
 import hashlib
 import logging
+import math
 import os
 import re
 import secrets
@@ -30,6 +31,8 @@ class AuthSecurityManager:
         self._signup_attempts: dict[str, list] = {}
         self._password_reset_attempts: dict[str, list] = {}
         self._blocked_ips: dict[str, datetime] = {}
+        self._email_send_cooldowns: dict[str, float] = {}
+        self._missing_emails: dict[str, float] = {}
 
         # Security configuration
         self.MAX_LOGIN_ATTEMPTS = 5
@@ -38,6 +41,8 @@ class AuthSecurityManager:
         self.RATE_LIMIT_WINDOW = 900  # 15 minutes
         self.BLOCK_DURATION = 3600  # 1 hour
         self.LOGIN_ATTEMPT_WINDOW = 300  # 5 minutes
+        self.EMAIL_SEND_COOLDOWN = 60  # 1 verification/reset email per minute per address
+        self.MISSING_EMAIL_TTL = 30  # Cache "no such devotee" lookups for 30 seconds
 
     def _get_client_ip(self, request: Request) -> str:
         """Extract client IP address from request."""
@@ -180,6 +185,61 @@ class AuthSecurityManager:
 
         self._password_reset_attempts[key].append(current_time)
 
+    def _email_key(self, email: str) -> str:
+        """Hash an email address for use as an in-memory key."""
+        return hashlib.sha256(email.lower().encode()).hexdigest()
+
+    def _purge_expired(self, expiries: dict[str, float]) -> None:
+        """Remove entries whose expiry time has passed."""
+        current_time = time.time()
+        for key in [k for k, until in expiries.items() if until <= current_time]:
+            del expiries[key]
+
+    def check_email_send_cooldown(self, email: str, purpose: str) -> None:
+        """
+        Allow one outgoing email per address and purpose per cooldown window.
+
+        Stops repeated clicks on resend/forgot-password from hitting the
+        database and the mail API on every request. The window starts when
+        :meth:`record_email_sent` is called, so a failed send can be retried
+        straight away. The 429 carries the remaining wait in ``Retry-After``.
+        """
+        self._purge_expired(self._email_send_cooldowns)
+
+        until = self._email_send_cooldowns.get(f"{purpose}:{self._email_key(email)}")
+        if until is not None:
+            retry_after = max(1, math.ceil(until - time.time()))
+            raise HTTPException(
+                status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+                detail="Too many requests. Please wait a minute before trying again.",
+                headers={"Retry-After": str(retry_after)},
+            )
+
+    def record_email_sent(self, email: str, purpose: str) -> None:
+        """Start the cooldown window once an email has been queued for sending."""
+        key = f"{purpose}:{self._email_key(email)}"
+        self._email_send_cooldowns[key] = time.time() + self.EMAIL_SEND_COOLDOWN
+
+    def is_email_known_missing(self, email: str) -> bool:
+        """Check whether a recent lookup found no devotee for this email."""
+        key = self._email_key(email)
+        until = self._missing_emails.get(key)
+        if until is None:
+            return False
+        if until <= time.time():
+            del self._missing_emails[key]
+            return False
+        return True
+
+    def remember_missing_email(self, email: str) -> None:
+        """Cache a failed devotee lookup for a short time."""
+        self._purge_expired(self._missing_emails)
+        self._missing_emails[self._email_key(email)] = time.time() + self.MISSING_EMAIL_TTL
+
+    def forget_missing_email(self, email: str) -> None:
+        """Drop a cached failed lookup once the email is registered."""
+        self._missing_emails.pop(self._email_key(email), None)
+
     def record_successful_login(self, request: Request, email: str) -> None:
         """Clear login attempts after successful login."""
         ip = self._get_client_ip(request)
@@ -377,6 +437,11 @@ class SecureTokenManager:
         timestamp = str(int(time.time()))
         return f"{random_part}.{timestamp}.{email_hash}"
 
+    @staticmethod
+    def hash_token(token: str) -> bytes:
+        """Return the SHA-256 digest stored in place of an emailed token."""
+        return hashlib.sha256(token.encode()).digest()
+
     @staticmethod
     def validate_token_format(token: str) -> bool:
         """Validate token format to prevent injection attacks."""
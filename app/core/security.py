@@ -1,8 +1,8 @@
 """
 Authentication utilities for JWT tokens and password hashing.
 
-This module provides secure authentication functions using bcrypt for password
-hashing and JWT for token-based authentication.
+This module provides secure authentication functions using argon2id for password
+hashing (verifying legacy bcrypt hashes) and JWT for token-based authentication.
 """
 
 from datetime import UTC, datetime, timedelta
@@ -18,8 +18,16 @@ from app.core.responses import StandardHTTPException
 from app.db.models import Devotee
 from app.db.session import get_db
 
-# Password hashing context
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# Password hashing context: new hashes use argon2id, whose C implementation
+# releases the GIL so concurrent logins hash in parallel across threads.
+# bcrypt hashes still verify and are upgraded on the next successful login.
+pwd_context = CryptContext(
+    schemes=["argon2", "bcrypt"],
+    deprecated="auto",
+    argon2__time_cost=2,
+    argon2__memory_cost=19456,  # KiB (19 MiB), the OWASP baseline for argon2id
+    argon2__parallelism=1,
+)
 
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
@@ -49,6 +57,19 @@ def get_password_hash(password: str) -> str:
     return pwd_context.hash(password)
 
 
+def password_needs_rehash(hashed_password: str) -> bool:
+    """
+    Check whether a stored hash uses a deprecated scheme or outdated parameters.
+
+    Args:
+        hashed_password: The hashed password from database
+
+    Returns:
+        True if the hash should be replaced after the next successful login
+    """
+    return pwd_context.needs_update(hashed_password)
+
+
 def create_access_token(data: dict, expires_delta: timedelta | None = None) -> str:
     """
     Create a JWT access token.
@@ -8,6 +8,8 @@ Enhanced devotee management system for ISKCON Radha Shyam Sundar Yatra.
 from enum import Enum
 
 from sqlalchemy import (
+    BINARY,
+    BigInteger,
     Boolean,
     Column,
     Date,
@@ -17,17 +19,28 @@ from sqlalchemy import (
     Integer,
     String,
     Text,
+    TypeDecorator,
     UniqueConstraint,
     event,
 )
 from sqlalchemy import Enum as SQLEnum
 from sqlalchemy.dialects.mysql import JSON
 from sqlalchemy.orm import declarative_base
-from sqlalchemy.sql import func
+from sqlalchemy.sql import false, func
 
 Base = declarative_base()
 
 
+class LowerString(TypeDecorator):
+    """String column whose values are stored, and compared, in lowercase."""
+
+    impl = String
+    cache_ok = True
+
+    def process_bind_param(self, value, dialect):
+        return value.strip().lower() if value else value
+
+
 class UserRole(str, Enum):
     """User roles enumeration."""
 
@@ -127,12 +140,12 @@ class Devotee(Base):
     id = Column(Integer, primary_key=True, index=True)
 
     # Authentication (consistent with existing system)
-    email = Column(String(255), unique=True, nullable=False, index=True)
+    email = Column(LowerString(255), unique=True, nullable=False, index=True)
     password_hash = Column(String(255), nullable=False)
 
     # Email verification
-    email_verified = Column(Boolean, nullable=False, default=False)
-    verification_token = Column(String(255), nullable=True)
+    email_verified = Column(Boolean, nullable=False, default=False, server_default=false())
+    verification_token_hash = Column(BINARY(32), nullable=True, index=True)  # SHA-256 of token
     verification_expires = Column(DateTime(timezone=True), nullable=True)
 
     # Personal Information
@@ -196,12 +209,15 @@ class Devotee(Base):
     uploaded_files = Column(
         JSON, nullable=True
     )  # Array of file metadata: [{name, path, type, size, uploaded_at}]
+    total_upload_bytes = Column(
+        BigInteger, nullable=False, default=0, server_default="0"
+    )  # Sum of uploaded_files sizes, kept in step with the array
 
     # System Fields
     role = Column(SQLEnum(UserRole), nullable=False, default=UserRole.USER)
-    password_reset_token = Column(String(255), nullable=True)
+    password_reset_token_hash = Column(BINARY(32), nullable=True, index=True)  # SHA-256 of token
     password_reset_expires = Column(DateTime(timezone=True), nullable=True)
-    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), index=True)
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
 
     # Performance optimization indexes
@@ -209,14 +225,45 @@ class Devotee(Base):
         Index("idx_city_country", "city", "country"),
         Index("idx_location_search", "country", "state_province", "city"),
         Index("idx_spiritual_info", "initiation_status", "spiritual_master"),
-        Index("idx_name_search", "legal_name"),
+        # Covering index: name-ordered search walks the index and stops at LIMIT
+        Index(
+            "ix_devotees_legal_name_cover", "legal_name", "email", "country", "initiation_status"
+        ),
         Index("idx_mobile_search", "country_code", "mobile_number"),
+        # Filter + default sort for the devotee list; InnoDB appends the id
+        # tie-breaker to every secondary index, so the page is read in order
+        Index("ix_devotees_initiation_created", "initiation_status", "created_at"),
+        Index("ix_devotees_gender_created", "gender", "created_at"),
+        Index(
+            "ix_devotees_fts",
+            "legal_name",
+            "email",
+            "city",
+            "country",
+            "spiritual_master",
+            mysql_prefix="FULLTEXT",
+        ),
     )
 
     def __repr__(self):
         return f"<Devotee(id={self.id}, email={self.email}, legal_name={self.legal_name})>"
 
 
+# Functional indexes backing the case-insensitive location and spiritual master lookups
+Index(
+    "ix_devotees_location_lower",
+    func.lower(Devotee.country),
+    func.lower(Devotee.state_province),
+    func.lower(Devotee.city),
+)
+Index("ix_devotees_spiritual_master_lower", func.lower(Devotee.spiritual_master))
+Index("ix_devotees_country_lower_created", func.lower(Devotee.country), Devotee.created_at)
+# State or city filters given without a country can't use the location
+# index's leading lower(country) key part
+Index("ix_devotees_state_lower", func.lower(Devotee.state_province))
+Index("ix_devotees_city_lower", func.lower(Devotee.city))
+
+
 # User model removed - using Devotee model only for production
 
 
@@ -11,6 +11,7 @@ from collections.abc import Generator
 from contextlib import contextmanager
 from functools import wraps
 
+import orjson
 from sqlalchemy import create_engine, event, exc, text
 from sqlalchemy.orm import sessionmaker
 from sqlalchemy.pool import QueuePool
@@ -20,6 +21,11 @@ from app.core.config import settings
 logger = logging.getLogger("app.db")
 
 
+def _orjson_dumps(value) -> str:
+    """Serialize a JSON column value; the DB driver expects text, not bytes."""
+    return orjson.dumps(value).decode()
+
+
 engine = create_engine(
     settings.get_database_url(),
     # Connection pool settings
@@ -33,6 +39,12 @@ engine = create_engine(
     echo=settings.debug,  # Log SQL in debug mode
     echo_pool=settings.debug,  # Log pool events in debug mode
     future=True,  # Use SQLAlchemy 2.0 style
+    # Each combination of list filters compiles to its own cached statement;
+    # room for those plus the lambda-cached lookups without LRU churn
+    query_cache_size=1200,
+    # orjson for JSON columns (children, uploaded_files): C-accelerated both ways
+    json_serializer=_orjson_dumps,
+    json_deserializer=orjson.loads,
     # Connection arguments for MySQL optimization
     connect_args=(
         {
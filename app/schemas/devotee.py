@@ -14,6 +14,13 @@ from app.core.password_validation import validate_password_strength
 from app.db.models import Gender, InitiationStatus, MaritalStatus, UserRole
 
 
+def _strip_text(v: Any) -> Any:
+    """Trim surrounding whitespace from a free-text value, mapping blanks to None."""
+    if isinstance(v, str):
+        return v.strip() or None
+    return v
+
+
 class DevoteeBase(BaseModel):
     """Base devotee model with common fields."""
 
@@ -101,6 +108,12 @@ class DevoteeBase(BaseModel):
         None, description="Devotional courses completed (comma-separated)"
     )
 
+    @field_validator("email")
+    @classmethod
+    def normalize_email(cls, v):
+        """Normalize email to lowercase."""
+        return v.lower()
+
     @field_validator("mobile_number")
     @classmethod
     def validate_mobile_number(cls, v):
@@ -171,6 +184,12 @@ class DevoteeSimpleCreate(BaseModel):
         examples=["SecurePass123!@#", "MyStr0ng@Password"],
     )
 
+    @field_validator("email")
+    @classmethod
+    def normalize_email(cls, v):
+        """Normalize email to lowercase."""
+        return v.lower()
+
     @field_validator("password")
     @classmethod
     def validate_password_strength_signup(cls, v):
@@ -197,6 +216,30 @@ class DevoteeCreate(DevoteeBase):
         """Validate password strength requirements."""
         return validate_password_strength(v)
 
+    @field_validator(
+        "legal_name",
+        "father_name",
+        "mother_name",
+        "spouse_name",
+        "address",
+        "city",
+        "state_province",
+        "country",
+        "postal_code",
+        "initiated_name",
+        "spiritual_master",
+        "initiation_place",
+        "counselor",
+        "who_introduced_you_to_iskcon",
+        "which_iskcon_center_you_first_connected_to",
+        "devotional_courses",
+        mode="before",
+    )
+    @classmethod
+    def strip_text_fields(cls, v):
+        """Trim whitespace from free-text fields."""
+        return _strip_text(v)
+
 
 class DevoteeUpdate(BaseModel):
     """Schema for updating devotee information."""
@@ -246,6 +289,30 @@ class DevoteeUpdate(BaseModel):
     # Devotional Education
     devotional_courses: str | None = None
 
+    @field_validator(
+        "legal_name",
+        "father_name",
+        "mother_name",
+        "spouse_name",
+        "address",
+        "city",
+        "state_province",
+        "country",
+        "postal_code",
+        "initiated_name",
+        "spiritual_master",
+        "initiation_place",
+        "spiritual_guide",
+        "who_introduced_you_to_iskcon",
+        "which_iskcon_center_you_first_connected_to",
+        "devotional_courses",
+        mode="before",
+    )
+    @classmethod
+    def strip_text_fields(cls, v):
+        """Trim whitespace from free-text fields."""
+        return _strip_text(v)
+
     @field_validator("mobile_number")
     @classmethod
     def validate_mobile_number(cls, v):
@@ -279,7 +346,8 @@ class DevoteeOut(DevoteeBase):
         """
         Extract children list from stored database structure.
 
-        Database stores: {"count": X, "children": [...], "updated_at": "..."}
+        Database stores: [...] (rows written before the list format:
+        {"count": X, "children": [...], "updated_at": "..."})
         API returns: [...]
         """
         if v is None:
@@ -310,6 +378,21 @@ class DevoteeOut(DevoteeBase):
     model_config = ConfigDict(from_attributes=True)
 
 
+class DevoteeSummary(BaseModel):
+    """Schema for compact devotee listings (location and spiritual master lookups)."""
+
+    id: int = Field(..., description="Devotee's unique identifier")
+    legal_name: str = Field(..., description="Legal full name")
+    email: EmailStr = Field(..., description="Email address")
+    city: str | None = Field(None, description="City")
+    state_province: str | None = Field(None, description="State or Province")
+    country: str | None = Field(None, description="Country")
+    spiritual_master: str | None = Field(None, description="Name of spiritual master")
+    initiation_status: InitiationStatus | None = Field(None, description="Initiation status")
+
+    model_config = ConfigDict(from_attributes=True)
+
+
 class DevoteeSearchFilters(BaseModel):
     """Schema for devotee search filters."""
 
@@ -342,6 +425,11 @@ class DevoteeSearchFilters(BaseModel):
     # Pagination
     page: int = Field(1, ge=1, description="Page number")
     limit: int = Field(50, ge=1, le=100, description="Items per page")
+    cursor: str | None = Field(
+        None,
+        max_length=200,
+        description="next_cursor from the previous page; pages by created_at instead of page",
+    )
 
     # Sorting
     sort_by: str | None = Field(
@@ -377,12 +465,17 @@ class DevoteeListResponse(BaseModel):
     """Schema for paginated devotee list response."""
 
     devotees: list[DevoteeOut]
-    total: int = Field(..., description="Total number of devotees matching filters")
+    total: int | None = Field(
+        ..., description="Total number of devotees matching filters (None on cursor pages)"
+    )
     page: int = Field(..., description="Current page number")
     limit: int = Field(..., description="Items per page")
-    total_pages: int = Field(..., description="Total number of pages")
+    total_pages: int | None = Field(..., description="Total number of pages (None on cursor pages)")
     has_next: bool = Field(..., description="Whether there are more pages")
     has_prev: bool = Field(..., description="Whether there are previous pages")
+    next_cursor: str | None = Field(
+        None, description="Cursor for the next page when sorting by created_at"
+    )
 
 
 class DevoteeStatsResponse(BaseModel):
@@ -6,38 +6,428 @@ query methods, search functionality, and comprehensive business rules.
 Designed for high performance with 100K users.
 """
 
+import asyncio
+import base64
+import json
 import logging
-import secrets
-from datetime import UTC, datetime, timedelta
+import os
+import re
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+from datetime import UTC, date, datetime, timedelta
+from functools import lru_cache
 from math import ceil
 from pathlib import Path
+from typing import Any
 
-from fastapi import HTTPException, UploadFile, status
+from fastapi import BackgroundTasks, HTTPException, UploadFile, status
 from pydantic import EmailStr
-from sqlalchemy import desc, func, or_, text
-from sqlalchemy.orm import Session
+from sqlalchemy import (
+    String,
+    and_,
+    case,
+    cast,
+    desc,
+    extract,
+    func,
+    insert,
+    lambda_stmt,
+    literal,
+    or_,
+    select,
+    union_all,
+    update,
+)
+from sqlalchemy.dialects.mysql import match
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session, defer, load_only, raiseload
 
+from app.core.auth_security import auth_security, token_manager
 from app.core.config import settings
 from app.core.responses import StandardHTTPException
-from app.core.security import get_password_hash, verify_password
+from app.core.security import get_password_hash, password_needs_rehash, verify_password
 from app.db.models import (
     Devotee,
+    Gender,
     InitiationStatus,
     MaritalStatus,
 )
 from app.schemas.devotee import (
     DevoteeCreate,
     DevoteeListResponse,
+    DevoteeOut,
     DevoteeSearchFilters,
     DevoteeStatsResponse,
+    DevoteeSummary,
     DevoteeUpdate,
 )
 from app.services.gmail_service import GmailService
-from app.services.storage_service import StorageService
+from app.services.storage_service import StorageService, get_storage_service
 
 logger = logging.getLogger(__name__)
 
 
+# Columns profile completion may write; file fields are set from the uploads
+# themselves and account/auth columns are never taken from profile data.
+_DEVOTEE_UPDATABLE_COLUMNS: frozenset[str] = frozenset(
+    column.key for column in Devotee.__table__.columns
+) - frozenset(
+    {
+        "id",
+        "email",
+        "password_hash",
+        "email_verified",
+        "verification_token_hash",
+        "verification_expires",
+        "password_reset_token_hash",
+        "password_reset_expires",
+        "role",
+        "profile_photo_path",
+        "uploaded_files",
+        "total_upload_bytes",
+        "created_at",
+        "updated_at",
+    }
+)
+
+# Upload limits, read once; settings are fixed for the life of the process
+_MAX_UPLOAD_BYTES = settings.max_upload_size_bytes
+_MAX_UPLOAD_MB = settings.max_upload_size_mb
+_MAX_FILES = settings.max_files_per_user
+
+# Token lifetimes and the "recently joined" statistics window
+_VERIFICATION_TTL = timedelta(hours=24)
+_RESET_TTL = timedelta(hours=1)
+_RECENT_WINDOW = timedelta(days=30)
+
+# Columns DevoteeSummary serializes; location and spiritual master lookups load only these
+_SUMMARY_COLUMNS = load_only(
+    Devotee.id,
+    Devotee.legal_name,
+    Devotee.email,
+    Devotee.city,
+    Devotee.state_province,
+    Devotee.country,
+    Devotee.spiritual_master,
+    Devotee.initiation_status,
+)
+
+# Credential, token and upload bookkeeping columns DevoteeOut never serializes
+_UNLISTED_COLUMNS = frozenset(
+    {
+        "password_hash",
+        "verification_token_hash",
+        "verification_expires",
+        "password_reset_token_hash",
+        "password_reset_expires",
+        "uploaded_files",
+    }
+)
+
+# Loader options for streamed devotee rows. Touching an unlisted column, or
+# any relationship, raises instead of quietly issuing a SELECT per row.
+_LIST_DEFERRED = (
+    *(defer(getattr(Devotee, key), raiseload=True) for key in sorted(_UNLISTED_COLUMNS)),
+    raiseload("*"),
+)
+
+# Columns the devotee list selects: everything DevoteeOut serializes plus
+# created_at for the cursor. Rows come back as plain tuples, with no ORM
+# instance or identity-map bookkeeping per devotee.
+_LIST_COLUMNS = tuple(
+    getattr(Devotee, column.key)
+    for column in Devotee.__table__.columns
+    if column.key not in _UNLISTED_COLUMNS
+)
+
+# Rows fetched per round trip when streaming devotees for exports
+_STREAM_BATCH_SIZE = 500
+
+# Enum-backed statistics dimensions; the database stores member names
+_STATS_ENUMS = {
+    "initiation_status": InitiationStatus,
+    "gender": Gender,
+    "marital_status": MaritalStatus,
+}
+
+# FULLTEXT search: boolean-mode operator characters are stripped from user input,
+# and words shorter than InnoDB's default innodb_ft_min_token_size aren't indexed
+_FULLTEXT_OPERATORS = str.maketrans(dict.fromkeys('+-<>()~*"@', " "))
+_FULLTEXT_MIN_TOKEN = 3
+
+# Verified against on unknown emails so failed logins take constant time
+_DUMMY_PASSWORD_HASH = get_password_hash("not-a-real-password")
+
+
+async def _send_email(template: str, **kwargs) -> None:
+    """Send one transactional email, logging instead of raising on failure."""
+    try:
+        await getattr(GmailService(), template)(**kwargs)
+    except Exception as e:
+        logger.warning(f"Failed to send {template} to {kwargs.get('email')}: {e!s}")
+
+
+async def _queue_email(background: BackgroundTasks | None, template: str, **kwargs) -> None:
+    """
+    Send an email after the response when the route supplied ``background``.
+
+    Callers commit their changes first, so the request never holds a
+    database connection across the Gmail round trip. Without ``background``
+    the email is sent inline.
+    """
+    if background is None:
+        await _send_email(template, **kwargs)
+    else:
+        background.add_task(_send_email, template, **kwargs)
+
+
+def _first_devotee(db: Session, stmt) -> Devotee | None:
+    """
+    Run a single-devotee lookup built with ``lambda_stmt``.
+
+    Lambda statements are compiled once and cached by the lambda's code
+    location; later calls only swap in the bound values, which keeps the
+    per-request lookups (email, verification and reset tokens) off the
+    SQL compiler.
+    """
+    return db.execute(stmt).scalars().first()
+
+
+# Duplicate-key errors raised by the unique email index: MySQL reports the
+# key ("for key 'devotees.ix_devotees_email'"), SQLite the column
+_DUPLICATE_EMAIL = re.compile(r"for key '(?:devotees\.)?(?:ix_devotees_)?email'|devotees\.email\b")
+
+
+def _is_duplicate_email(error: IntegrityError) -> bool:
+    """Return whether an IntegrityError came from the unique email index."""
+    return _DUPLICATE_EMAIL.search(str(error.orig)) is not None
+
+
+def _as_utc(value: datetime) -> datetime:
+    """Attach UTC to a naive datetime; MySQL DATETIME columns drop the timezone."""
+    return value.replace(tzinfo=UTC) if value.tzinfo is None else value
+
+
+def _http_400(message: str) -> StandardHTTPException:
+    """Build a 400 Bad Request error in the standard response format."""
+    return StandardHTTPException(status_code=status.HTTP_400_BAD_REQUEST, message=message)
+
+
+def _http_404(message: str) -> StandardHTTPException:
+    """Build a 404 Not Found error in the standard response format."""
+    return StandardHTTPException(status_code=status.HTTP_404_NOT_FOUND, message=message)
+
+
+def _http_409(message: str) -> StandardHTTPException:
+    """Build a 409 Conflict error in the standard response format."""
+    return StandardHTTPException(status_code=status.HTTP_409_CONFLICT, message=message)
+
+
+def _http_500(message: str) -> StandardHTTPException:
+    """Build a 500 Internal Server Error in the standard response format."""
+    return StandardHTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, message=message)
+
+
+# Sort fields accepted by get_devotees_with_filters
+_SORTABLE_COLUMNS = {
+    "legal_name": Devotee.legal_name,
+    "created_at": Devotee.created_at,
+    "city": Devotee.city,
+    "initiation_status": Devotee.initiation_status,
+}
+
+
+def _encode_cursor(created_at: datetime, devotee_id: int) -> str:
+    """Encode a (created_at, id) keyset position as an opaque URL-safe string."""
+    raw = json.dumps([created_at.isoformat(), devotee_id]).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def _decode_cursor(cursor: str) -> tuple[datetime, int]:
+    """Decode a cursor produced by :func:`_encode_cursor`."""
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        created_at, devotee_id = json.loads(raw)
+        return datetime.fromisoformat(created_at), int(devotee_id)
+    except (ValueError, TypeError) as e:
+        raise ValueError("invalid cursor") from e
+
+
+def _years_before(day: date, years: int) -> date:
+    """Return the same calendar day ``years`` earlier (Feb 29 becomes Feb 28)."""
+    try:
+        return day.replace(year=day.year - years)
+    except ValueError:
+        return day.replace(year=day.year - years, day=28)
+
+
+class _StatsCache:
+    """
+    Short-lived, process-local cache for the statistics overview.
+
+    Writes that change devotee data call :meth:`invalidate`; the TTL bounds
+    staleness from other workers. Only one thread recomputes at a time, and a
+    result computed across an invalidation is returned but not stored.
+    """
+
+    TTL_SECONDS = 60
+
+    def __init__(self):
+        self._value: DevoteeStatsResponse | None = None
+        self._expires_at = 0.0
+        self._generation = 0
+        self._lock = threading.Lock()
+
+    def get_or_compute(self, compute) -> DevoteeStatsResponse:
+        if self._value is not None and time.monotonic() < self._expires_at:
+            return self._value
+
+        with self._lock:
+            if self._value is not None and time.monotonic() < self._expires_at:
+                return self._value
+            generation = self._generation
+            value = compute()
+            if generation == self._generation:
+                self._value = value
+                self._expires_at = time.monotonic() + self.TTL_SECONDS
+            return value
+
+    def invalidate(self) -> None:
+        self._generation += 1
+        self._value = None
+
+
+_stats_cache = _StatsCache()
+
+
+class _TTLCache:
+    """
+    Short-lived, process-local LRU keyed by lookup arguments.
+
+    Entries expire ``ttl`` seconds after they are stored and the least
+    recently used entry is dropped beyond ``max_entries``.
+    """
+
+    def __init__(self, ttl: float, max_entries: int):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._entries: OrderedDict[Any, tuple[float, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+        # Bumped by clear(); callers put it in their keys so a value computed
+        # across a clear() is stored under a key nobody reads again
+        self.generation = 0
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if entry[0] <= time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return entry[1]
+
+    def put(self, key, value) -> None:
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl, value)
+            self._entries.move_to_end(key)
+            if len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, key) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self.generation += 1
+            self._entries.clear()
+
+
+# Typeahead results by (search text, limit): collapses the duplicate queries
+# a search box fires while the user types
+_search_cache = _TTLCache(ttl=5, max_entries=1024)
+
+# Devotee ids by normalized email, so repeat lookups (verification, resend,
+# password reset) become a primary-key get, often straight from the identity
+# map. Hits are checked against the loaded row's email, so an entry left
+# stale by an email change or deletion just falls through to the query.
+_email_id_cache = _TTLCache(ttl=30, max_entries=10_000)
+
+# Devotee list pages by filter set, for dashboards re-polling the same view.
+# Cleared on every devotee write in this process; the TTL bounds staleness
+# from other workers.
+_list_cache = _TTLCache(ttl=10, max_entries=256)
+
+
+def _devotees_changed() -> None:
+    """Drop cached statistics, list pages and search results after a devotee write."""
+    _stats_cache.invalidate()
+    _list_cache.clear()
+    _search_cache.clear()
+
+
+@lru_cache(maxsize=1024)
+def _purpose_from_filename(filename: str) -> str:
+    """Return a filename without its directory or extension ("passport.pdf" -> "passport")."""
+    return os.path.splitext(os.path.basename(filename))[0]
+
+
+def _fulltext_query(db: Session, search_text: str) -> str | None:
+    """
+    Return a boolean-mode MATCH ... AGAINST string for ``search_text``.
+
+    Each word becomes a required prefix term. Returns None when the database
+    isn't MySQL or a word is too short for the FULLTEXT index, in which case
+    callers fall back to a LIKE scan.
+    """
+    if db.get_bind().dialect.name != "mysql":
+        return None
+    words = search_text.translate(_FULLTEXT_OPERATORS).split()
+    if not words or any(len(word) < _FULLTEXT_MIN_TOKEN for word in words):
+        return None
+    return " ".join(f"+{word}*" for word in words)
+
+
+def _fast_file_size(uploaded_file: UploadFile) -> int:
+    """
+    Return the size of an uploaded file without seeking when possible.
+
+    Prefers the size Starlette recorded while parsing the upload, then the
+    part's Content-Length header, then the in-memory buffer length or the
+    file descriptor's stat, and only falls back to seeking to the end of the
+    stream.
+    """
+    if uploaded_file.size is not None:
+        return uploaded_file.size
+
+    content_length = uploaded_file.headers.get("content-length")
+    if content_length and content_length.isdigit():
+        return int(content_length)
+
+    # Look through SpooledTemporaryFile so fileno() doesn't force a rollover
+    backing = getattr(uploaded_file.file, "_file", uploaded_file.file)
+
+    getbuffer = getattr(backing, "getbuffer", None)
+    if getbuffer is not None:
+        return len(getbuffer())
+
+    try:
+        return os.fstat(backing.fileno()).st_size
+    except (AttributeError, OSError, ValueError):
+        pass
+
+    position = uploaded_file.file.tell()
+    uploaded_file.file.seek(0, 2)
+    size = uploaded_file.file.tell()
+    uploaded_file.file.seek(position)
+    return size
+
+
 class DevoteeService:
     """
     Enhanced service class for devotee business logic with performance optimizations.
@@ -58,7 +448,7 @@ class DevoteeService:
         db: Session,
         devotee_data: DevoteeCreate,
         photo: UploadFile | None = None,
-    ) -> Devotee:
+    ) -> DevoteeOut:
         """
         Create a new devotee with comprehensive validation and optimization.
 
@@ -68,111 +458,131 @@ class DevoteeService:
             photo: Optional photo file
 
         Returns:
-            Created Devotee instance
+            The created devotee, as returned by the API
 
         Raises:
             HTTPException: If devotee already exists or validation fails
         """
-        # Check if devotee exists
-        existing_devotee = self.get_devotee_by_email(db, devotee_data.email)
-        if existing_devotee:
-            raise StandardHTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                message="Devotee with this email already exists",
-                success=False,
-                data=None,
-            )
-
         # Validate business rules
         self._validate_devotee_data(devotee_data)
 
         # Handle photo upload
         # For new devotees, we don't have user_id yet, so we'll skip photo upload during creation
         # Photo can be uploaded later during profile completion
-        photo_path = None
         if photo:
             logger.info(
                 "Photo upload during signup is deprecated. Use complete-profile endpoint instead."
             )
 
-        # Prepare children data
-        children_json = None
-        if devotee_data.children:
-            children_json = {
-                "count": len(devotee_data.children),
-                "children": [child.model_dump() for child in devotee_data.children],
-                "updated_at": datetime.utcnow().isoformat(),
-            }
-
-        # Create devotee
-        db_devotee = Devotee(
-            # Authentication
-            email=devotee_data.email.lower(),
-            password_hash=get_password_hash(devotee_data.password),
-            # Personal Information
-            legal_name=devotee_data.legal_name.strip(),
-            date_of_birth=devotee_data.date_of_birth,
-            gender=devotee_data.gender,
-            marital_status=devotee_data.marital_status,
-            # Contact Information
-            country_code=devotee_data.country_code,
-            mobile_number=devotee_data.mobile_number,
-            national_id=devotee_data.national_id,
-            # Family Information
-            father_name=devotee_data.father_name.strip(),
-            mother_name=devotee_data.mother_name.strip(),
-            spouse_name=(devotee_data.spouse_name.strip() if devotee_data.spouse_name else None),
-            date_of_marriage=devotee_data.date_of_marriage,
-            children=children_json,
-            # Location Information
-            address=devotee_data.address.strip() if devotee_data.address else None,
-            city=devotee_data.city.strip() if devotee_data.city else None,
-            state_province=(
-                devotee_data.state_province.strip() if devotee_data.state_province else None
-            ),
-            country=devotee_data.country.strip() if devotee_data.country else None,
-            postal_code=(devotee_data.postal_code.strip() if devotee_data.postal_code else None),
-            # ISKCON Spiritual Information
-            initiation_status=devotee_data.initiation_status,
-            spiritual_master=(
-                devotee_data.spiritual_master.strip() if devotee_data.spiritual_master else None
-            ),
-            initiation_date=devotee_data.initiation_date,
-            initiation_place=(
-                devotee_data.initiation_place.strip() if devotee_data.initiation_place else None
-            ),
-            spiritual_guide=(
-                devotee_data.spiritual_guide.strip() if devotee_data.spiritual_guide else None
-            ),
-            # ISKCON Journey
-            when_were_you_introduced_to_iskcon=devotee_data.when_were_you_introduced_to_iskcon,
-            who_introduced_you_to_iskcon=(
-                devotee_data.who_introduced_you_to_iskcon.strip()
-                if devotee_data.who_introduced_you_to_iskcon
-                else None
-            ),
-            which_iskcon_center_you_first_connected_to=(
-                devotee_data.which_iskcon_center_you_first_connected_to.strip()
-                if devotee_data.which_iskcon_center_you_first_connected_to
-                else None
-            ),
-            # Chanting Practice
-            chanting_number_of_rounds=devotee_data.chanting_number_of_rounds,
-            chanting_16_rounds_since=devotee_data.chanting_16_rounds_since,
-            # Devotional Education
-            devotional_courses=(
-                devotee_data.devotional_courses.strip() if devotee_data.devotional_courses else None
-            ),
-            # Photo
-            photo=photo_path,
+        values = self._devotee_values(devotee_data, get_password_hash(devotee_data.password))
+
+        # Let the unique email index reject duplicates: no SELECT round trip
+        # beforehand, and no race between two signups for the same address
+        try:
+            result = db.execute(insert(Devotee).values(**values))
+            db.commit()
+        except IntegrityError as e:
+            db.rollback()
+            if _is_duplicate_email(e):
+                raise _http_400("Devotee with this email already exists") from None
+            logger.error("Failed to create devotee: %s", e.orig)
+            raise _http_500("Failed to create devotee") from None
+        _devotees_changed()
+
+        logger.info(f"Created devotee: {values['email']}")
+        # Build the response from the inserted values instead of reloading the row
+        return DevoteeOut.model_validate({**values, "id": result.inserted_primary_key[0]})
+
+    def bulk_create_devotees(self, db: Session, rows: list[DevoteeCreate]) -> int:
+        """
+        Create many devotees in one multi-row INSERT (admin imports).
+
+        Emails already registered, or repeated within ``rows``, are rejected
+        up front so the insert either adds every row or none. A signup that
+        registers one of the emails while the batch is being hashed is
+        caught by the unique index and rejected the same way.
+
+        Args:
+            db: Database session
+            rows: Devotee creation data
+
+        Returns:
+            Number of devotees created
+
+        Raises:
+            HTTPException: If any email already exists
+        """
+        emails = [row.email for row in rows]
+        existing = (
+            {email for (email,) in db.query(Devotee.email).filter(Devotee.email.in_(emails))}
+            if emails
+            else set()
         )
+        if existing or len(set(emails)) != len(emails):
+            raise _http_400("One or more devotees with these emails already exist")
 
-        db.add(db_devotee)
-        db.commit()
-        db.refresh(db_devotee)
+        for row in rows:
+            self._validate_devotee_data(row)
+
+        # argon2-cffi hashes in C with the GIL released, so hashing in threads
+        # runs in parallel
+        with ThreadPoolExecutor() as executor:
+            password_hashes = list(executor.map(get_password_hash, (r.password for r in rows)))
+
+        try:
+            db.execute(
+                insert(Devotee),
+                [
+                    self._devotee_values(row, password_hash)
+                    for row, password_hash in zip(rows, password_hashes, strict=True)
+                ],
+            )
+            db.commit()
+        except IntegrityError as e:
+            db.rollback()
+            if _is_duplicate_email(e):
+                raise _http_400("One or more devotees with these emails already exist") from None
+            logger.error("Failed to bulk create devotees: %s", e.orig)
+            raise _http_500("Failed to create devotees") from None
+        _devotees_changed()
+
+        logger.info(f"Bulk created {len(rows)} devotees")
+        return len(rows)
+
+    @staticmethod
+    def _devotee_values(devotee_data: DevoteeCreate, password_hash: str) -> dict:
+        """Build the devotees column values for a new devotee."""
+        values = devotee_data.model_dump(exclude={"password", "children", "counselor"})
+        values["password_hash"] = password_hash
+        values["spiritual_guide"] = devotee_data.counselor
+        values["children"] = devotee_data.children or None
+        return values
+
+    def _validate_devotee_data(self, devotee_data: DevoteeCreate) -> None:
+        """
+        Validate business rules for a new devotee.
 
-        logger.info(f"Created devotee: {db_devotee.email}")
-        return db_devotee
+        Args:
+            devotee_data: Devotee creation data
+
+        Raises:
+            ValueError: If validation fails
+        """
+        birth_date = devotee_data.date_of_birth
+        if not birth_date:
+            return
+
+        if devotee_data.date_of_marriage and devotee_data.date_of_marriage < birth_date:
+            raise ValueError("Date of marriage cannot be before date of birth")
+
+        if devotee_data.initiation_date and devotee_data.initiation_date < birth_date:
+            raise ValueError("Initiation date cannot be before date of birth")
+
+        if (
+            devotee_data.chanting_16_rounds_since
+            and devotee_data.chanting_16_rounds_since < birth_date
+        ):
+            raise ValueError("Chanting start date cannot be before date of birth")
 
     def get_devotees_with_filters(
         self, db: Session, filters: DevoteeSearchFilters
@@ -181,34 +591,73 @@ class DevoteeService:
         Get paginated list of devotees with comprehensive filtering and search.
         Optimized for performance with proper indexing.
 
+        Pages are addressed by ``filters.page`` (OFFSET) or, when sorting by
+        ``created_at``, by the opaque ``filters.cursor`` returned as
+        ``next_cursor``. Cursor pages seek straight to the next row instead of
+        scanning and discarding every earlier one, and skip the total count.
+        Identical requests within a few seconds are served from a cache.
+
         Args:
             db: Database session
             filters: Search and filter criteria
 
         Returns:
             Paginated devotee list response
-        """
-        query = db.query(Devotee)
 
-        # Apply filters
-        query = self._apply_search_filters(query, filters)
+        Raises:
+            ValueError: If the cursor is malformed or used with another sort field
+        """
+        keyset = filters.sort_by in (None, "created_at")
+        if filters.cursor and not keyset:
+            raise ValueError("cursor pagination is only supported when sorting by created_at")
 
-        # Get total count for pagination
-        total = query.count()
+        cache_key = (_list_cache.generation, filters.model_dump_json())
+        cached = _list_cache.get(cache_key)
+        if cached is not None:
+            return cached
 
-        # Apply sorting
+        query = self._apply_search_filters(db.query(*_LIST_COLUMNS), filters)
         query = self._apply_sorting(query, filters.sort_by, filters.sort_order)
 
-        # Apply pagination
-        offset = (filters.page - 1) * filters.limit
-        devotees = query.offset(offset).limit(filters.limit).all()
-
-        # Calculate pagination metadata
-        total_pages = ceil(total / filters.limit)
-        has_next = filters.page < total_pages
-        has_prev = filters.page > 1
+        if filters.cursor:
+            created_at, last_id = _decode_cursor(filters.cursor)
+            if filters.sort_order == "asc":
+                after = or_(
+                    Devotee.created_at > created_at,
+                    and_(Devotee.created_at == created_at, Devotee.id > last_id),
+                )
+            else:
+                after = or_(
+                    Devotee.created_at < created_at,
+                    and_(Devotee.created_at == created_at, Devotee.id < last_id),
+                )
+            rows = query.filter(after).limit(filters.limit + 1).all()
+            devotees = rows[: filters.limit]
+            has_next = len(rows) > filters.limit
+            total = total_pages = None
+            has_prev = True
+        else:
+            # Piggyback the total on the page query instead of a separate COUNT
+            offset = (filters.page - 1) * filters.limit
+            rows = (
+                query.add_columns(func.count().over().label("total"))
+                .offset(offset)
+                .limit(filters.limit)
+                .all()
+            )
+            devotees = rows
+            total = rows[0].total if rows else (query.count() if offset else 0)
+            total_pages = ceil(total / filters.limit)
+            has_next = filters.page < total_pages
+            has_prev = filters.page > 1
+
+        next_cursor = (
+            _encode_cursor(devotees[-1].created_at, devotees[-1].id)
+            if keyset and has_next and devotees
+            else None
+        )
 
-        return DevoteeListResponse(
+        result = DevoteeListResponse(
             devotees=devotees,
             total=total,
             page=filters.page,
@@ -216,15 +665,105 @@ class DevoteeService:
             total_pages=total_pages,
             has_next=has_next,
             has_prev=has_prev,
+            next_cursor=next_cursor,
         )
+        _list_cache.put(cache_key, result)
+        return result
+
+    def _apply_search_filters(self, query, filters: DevoteeSearchFilters):
+        """
+        Apply the text search and field filters from ``filters`` to ``query``.
+
+        The text search uses the FULLTEXT index where it can, with the same
+        word-prefix semantics as :meth:`search_devotees_by_text`.
+        """
+        against = _fulltext_query(query.session, filters.search) if filters.search else None
+        if against is not None:
+            # One FULLTEXT index lookup instead of five OR-ed substring scans
+            query = query.filter(
+                match(
+                    Devotee.legal_name,
+                    Devotee.email,
+                    Devotee.city,
+                    Devotee.country,
+                    Devotee.spiritual_master,
+                    against=against,
+                ).in_boolean_mode()
+            )
+        elif filters.search:
+            search_pattern = f"%{filters.search.strip().lower()}%"
+            query = query.filter(
+                or_(
+                    func.lower(Devotee.legal_name).like(search_pattern),
+                    Devotee.email.like(search_pattern),
+                    func.lower(Devotee.city).like(search_pattern),
+                    func.lower(Devotee.country).like(search_pattern),
+                    func.lower(Devotee.spiritual_master).like(search_pattern),
+                )
+            )
+
+        if filters.country:
+            query = query.filter(func.lower(Devotee.country) == filters.country.lower())
+        if filters.state_province:
+            query = query.filter(
+                func.lower(Devotee.state_province) == filters.state_province.lower()
+            )
+        if filters.city:
+            query = query.filter(func.lower(Devotee.city) == filters.city.lower())
+        if filters.spiritual_master:
+            query = query.filter(
+                func.lower(Devotee.spiritual_master) == filters.spiritual_master.lower()
+            )
+
+        if filters.initiation_status:
+            query = query.filter(Devotee.initiation_status == filters.initiation_status)
+        if filters.gender:
+            query = query.filter(Devotee.gender == filters.gender)
+        if filters.marital_status:
+            query = query.filter(Devotee.marital_status == filters.marital_status)
+
+        # Age bounds become date_of_birth bounds so the column stays sargable
+        today = date.today()
+        if filters.min_age is not None:
+            query = query.filter(Devotee.date_of_birth <= _years_before(today, filters.min_age))
+        if filters.max_age is not None:
+            query = query.filter(Devotee.date_of_birth > _years_before(today, filters.max_age + 1))
+
+        if filters.min_rounds is not None:
+            query = query.filter(Devotee.chanting_number_of_rounds >= filters.min_rounds)
+        if filters.max_rounds is not None:
+            query = query.filter(Devotee.chanting_number_of_rounds <= filters.max_rounds)
+
+        return query
+
+    def _apply_sorting(self, query, sort_by: str | None, sort_order: str | None):
+        """Order ``query`` by a whitelisted field, with ``id`` as the tie-breaker."""
+        column = _SORTABLE_COLUMNS.get(sort_by or "created_at")
+        if column is None:
+            raise ValueError(f"sort_by must be one of: {', '.join(_SORTABLE_COLUMNS)}")
+        if sort_order == "asc":
+            return query.order_by(column.asc(), Devotee.id.asc())
+        return query.order_by(column.desc(), Devotee.id.desc())
 
     def get_devotee_by_id(self, db: Session, devotee_id: int) -> Devotee | None:
-        """Get devotee by ID with optimized query."""
-        return db.query(Devotee).filter(Devotee.id == devotee_id).first()
+        """Get devotee by ID, served from the identity map when already loaded."""
+        return db.get(Devotee, devotee_id)
 
     def get_devotee_by_email(self, db: Session, email: EmailStr) -> Devotee | None:
-        """Get devotee by email with optimized query."""
-        return db.query(Devotee).filter(Devotee.email == email.lower()).first()
+        """Get devotee by email with a cached statement and cached id lookup."""
+        key = email.strip().lower()
+        devotee_id = _email_id_cache.get(key)
+        if devotee_id is not None:
+            devotee = db.get(Devotee, devotee_id)
+            if devotee is not None and devotee.email == key:
+                return devotee
+
+        devotee = _first_devotee(
+            db, lambda_stmt(lambda: select(Devotee).where(Devotee.email == email))
+        )
+        if devotee is not None:
+            _email_id_cache.put(key, devotee.id)
+        return devotee
 
     def _validate_devotee_update(
         self, devotee_update: DevoteeUpdate, existing_devotee: Devotee
@@ -340,21 +879,9 @@ class DevoteeService:
         # Update only provided fields
         update_data = devotee_update.model_dump(exclude_unset=True)
 
-        # Handle children data
-        if "children" in update_data and update_data["children"] is not None:
-            children_json = {
-                "count": len(update_data["children"]),
-                "children": [
-                    child.model_dump() if hasattr(child, "model_dump") else child
-                    for child in update_data["children"]
-                ],
-                "updated_at": datetime.utcnow().isoformat(),
-            }
-            update_data["children"] = children_json
-
         # Handle photo upload
         if photo:
-            storage_service = StorageService()
+            storage_service = get_storage_service()
 
             # Delete old photo if exists
             if devotee.profile_photo_path:
@@ -367,14 +894,14 @@ class DevoteeService:
             )
             update_data["photo_path"] = photo_metadata["gcs_path"]
 
-        # Apply updates with string trimming
+        # Text fields arrive already trimmed by DevoteeUpdate
         for field, value in update_data.items():
-            if isinstance(value, str):
-                value = value.strip() if value else None
             setattr(devotee, field, value)
 
+        # Set updated_at here so the in-session devotee needs no refresh
+        devotee.updated_at = datetime.now(UTC)
         db.commit()
-        db.refresh(devotee)
+        _devotees_changed()
 
         logger.info(f"Updated devotee: {devotee.email}")
         return devotee
@@ -382,85 +909,104 @@ class DevoteeService:
     def get_devotee_statistics(self, db: Session) -> DevoteeStatsResponse:
         """
         Get comprehensive devotee statistics for dashboard and analytics.
-        Uses optimized queries with proper aggregation.
+        Uses optimized queries with proper aggregation, cached briefly since
+        dashboards poll far more often than devotees change.
 
         Returns:
             Comprehensive statistics response
         """
-        # Total devotees
-        total_devotees = db.query(func.count(Devotee.id)).scalar()
-
-        # Recently joined (last 30 days)
-        thirty_days_ago = datetime.utcnow() - timedelta(days=30)
-        recently_joined = (
-            db.query(func.count(Devotee.id)).filter(Devotee.created_at >= thirty_days_ago).scalar()
+        return _stats_cache.get_or_compute(lambda: self._compute_devotee_statistics(db))
+
+    def _compute_devotee_statistics(self, db: Session) -> DevoteeStatsResponse:
+        """Run the statistics aggregation queries."""
+        # Scalar aggregates in one scan: totals, recent joins and averages
+        thirty_days_ago = datetime.now(UTC) - _RECENT_WINDOW
+
+        # Portable age in whole years, minus one before this year's birthday
+        today = date.today()
+        birthday_pending = case(
+            (
+                extract("month", Devotee.date_of_birth) * 100
+                + extract("day", Devotee.date_of_birth)
+                > today.month * 100 + today.day,
+                1,
+            ),
+            else_=0,
         )
+        age_years = today.year - extract("year", Devotee.date_of_birth) - birthday_pending
 
-        # Statistics by country (top 10)
-        by_country = dict(
-            db.query(Devotee.country, func.count(Devotee.id))
-            .filter(Devotee.country.isnot(None))
+        totals = db.query(
+            func.count(Devotee.id).label("total_devotees"),
+            func.sum(case((Devotee.created_at >= thirty_days_ago, 1), else_=0)).label(
+                "recently_joined"
+            ),
+            func.avg(age_years).label("avg_age"),
+            func.avg(Devotee.chanting_number_of_rounds).label("avg_rounds"),
+        ).one()
+        average_age = float(totals.avg_age) if totals.avg_age else None
+        average_chanting_rounds = float(totals.avg_rounds) if totals.avg_rounds else None
+
+        # All breakdowns in one round-trip, tagged by dimension
+        top_countries = (
+            select(
+                literal("country").label("dimension"),
+                Devotee.country.label("value"),
+                func.count(Devotee.id).label("count"),
+            )
+            .where(Devotee.country.isnot(None))
             .group_by(Devotee.country)
             .order_by(desc(func.count(Devotee.id)))
             .limit(10)
-            .all()
-        )
-
-        # Statistics by initiation status
-        by_initiation_status = dict(
-            db.query(Devotee.initiation_status, func.count(Devotee.id))
-            .filter(Devotee.initiation_status.isnot(None))
-            .group_by(Devotee.initiation_status)
-            .all()
+            .subquery()
         )
-
-        # Statistics by gender
-        by_gender = dict(
-            db.query(Devotee.gender, func.count(Devotee.id)).group_by(Devotee.gender).all()
-        )
-
-        # Statistics by marital status
-        by_marital_status = dict(
-            db.query(Devotee.marital_status, func.count(Devotee.id))
-            .group_by(Devotee.marital_status)
-            .all()
-        )
-
-        # Average age calculation
-        avg_age_query = db.query(
-            func.avg(func.timestampdiff(text("YEAR"), Devotee.date_of_birth, func.curdate())).label(
-                "avg_age"
+        breakdowns = [select(top_countries)]
+        for dimension, column in (
+            ("initiation_status", Devotee.initiation_status),
+            ("gender", Devotee.gender),
+            ("marital_status", Devotee.marital_status),
+        ):
+            breakdowns.append(
+                select(
+                    literal(dimension),
+                    cast(column, String),
+                    func.count(Devotee.id),
+                )
+                .where(column.isnot(None))
+                .group_by(column)
             )
-        ).first()
-        average_age = float(avg_age_query.avg_age) if avg_age_query.avg_age else None
 
-        # Average chanting rounds
-        avg_rounds_query = (
-            db.query(func.avg(Devotee.chanting_number_of_rounds).label("avg_rounds"))
-            .filter(Devotee.chanting_number_of_rounds.isnot(None))
-            .first()
-        )
-        average_chanting_rounds = (
-            float(avg_rounds_query.avg_rounds) if avg_rounds_query.avg_rounds else None
-        )
+        grouped: dict[str, dict] = {
+            "country": {},
+            "initiation_status": {},
+            "gender": {},
+            "marital_status": {},
+        }
+        for dimension, value, count in db.execute(union_all(*breakdowns)):
+            enum_cls = _STATS_ENUMS.get(dimension)
+            grouped[dimension][enum_cls[value] if enum_cls else value] = count
 
         return DevoteeStatsResponse(
-            total_devotees=total_devotees,
-            by_country=by_country,
-            by_initiation_status=by_initiation_status,
-            by_gender=by_gender,
-            by_marital_status=by_marital_status,
+            total_devotees=totals.total_devotees,
+            by_country=grouped["country"],
+            by_initiation_status=grouped["initiation_status"],
+            by_gender=grouped["gender"],
+            by_marital_status=grouped["marital_status"],
             average_age=average_age,
             average_chanting_rounds=average_chanting_rounds,
-            recently_joined=recently_joined,
+            recently_joined=totals.recently_joined or 0,
         )
 
     def search_devotees_by_text(
         self, db: Session, search_text: str, limit: int = 20
-    ) -> list[Devotee]:
+    ) -> list[DevoteeSummary]:
         """
         Perform fast text search across multiple fields.
-        Uses optimized LIKE queries with proper indexing.
+
+        On MySQL this is a prefix search against the FULLTEXT index, so every
+        word must start a word in one of the searched columns. Terms shorter
+        than the InnoDB minimum token size, and other databases, fall back to
+        a substring LIKE scan. Results are cached for a few seconds, since a
+        typeahead repeats the same query as the user types.
 
         Args:
             db: Database session
@@ -468,25 +1014,56 @@ class DevoteeService:
             limit: Maximum results to return
 
         Returns:
-            List of matching devotees
+            List of matching devotee summaries
         """
-        search_pattern = f"%{search_text.lower()}%"
-
-        return (
-            db.query(Devotee)
-            .filter(
-                or_(
-                    func.lower(Devotee.legal_name).like(search_pattern),
-                    func.lower(Devotee.email).like(search_pattern),
-                    func.lower(Devotee.city).like(search_pattern),
-                    func.lower(Devotee.country).like(search_pattern),
-                    func.lower(Devotee.spiritual_master).like(search_pattern),
+        cache_key = (search_text.lower(), limit)
+        results = _search_cache.get(cache_key)
+        if results is not None:
+            return results
+
+        against = _fulltext_query(db, search_text)
+        if against is not None:
+            stmt = lambda_stmt(
+                lambda: (
+                    select(Devotee)
+                    .options(_SUMMARY_COLUMNS)
+                    .where(
+                        match(
+                            Devotee.legal_name,
+                            Devotee.email,
+                            Devotee.city,
+                            Devotee.country,
+                            Devotee.spiritual_master,
+                            against=against,
+                        ).in_boolean_mode()
+                    )
+                    .order_by(Devotee.legal_name)
+                    .limit(limit)
                 )
             )
-            .order_by(Devotee.legal_name)
-            .limit(limit)
-            .all()
-        )
+        else:
+            search_pattern = f"%{search_text.lower()}%"
+            stmt = lambda_stmt(
+                lambda: (
+                    select(Devotee)
+                    .options(_SUMMARY_COLUMNS)
+                    .where(
+                        or_(
+                            func.lower(Devotee.legal_name).like(search_pattern),
+                            Devotee.email.like(search_pattern),
+                            func.lower(Devotee.city).like(search_pattern),
+                            func.lower(Devotee.country).like(search_pattern),
+                            func.lower(Devotee.spiritual_master).like(search_pattern),
+                        )
+                    )
+                    .order_by(Devotee.legal_name)
+                    .limit(limit)
+                )
+            )
+
+        results = [DevoteeSummary.model_validate(d) for d in db.execute(stmt).scalars()]
+        _search_cache.put(cache_key, results)
+        return results
 
     def get_devotees_by_location(
         self,
@@ -494,310 +1071,318 @@ class DevoteeService:
         country: str | None = None,
         state: str | None = None,
         city: str | None = None,
-    ) -> list[Devotee]:
+        limit: int = 100,
+        after_id: int | None = None,
+    ) -> tuple[list[Devotee], int | None]:
         """
-        Get devotees by location using optimized queries with proper indexes.
+        Get one page of devotees by location using keyset pagination.
 
         Args:
             db: Database session
             country: Country filter
             state: State/Province filter
             city: City filter
+            limit: Maximum devotees to return
+            after_id: Return devotees with id greater than this (cursor from previous page)
 
         Returns:
-            List of devotees matching location criteria
+            Tuple of (devotees, next_after_id); next_after_id is None on the last page
         """
-        query = db.query(Devotee)
+        query = self._location_query(db, country, state, city).options(_SUMMARY_COLUMNS)
+        return self._keyset_page(query, limit, after_id)
 
+    def iter_devotees_by_location(
+        self,
+        db: Session,
+        country: str | None = None,
+        state: str | None = None,
+        city: str | None = None,
+    ) -> Iterator[Devotee]:
+        """
+        Stream every devotee matching a location filter, for exports.
+
+        Rows come from a server-side cursor in batches of
+        ``_STREAM_BATCH_SIZE``, so memory stays flat however many devotees
+        match. Leave all filters empty to stream everyone.
+        """
+        query = (
+            self._location_query(db, country, state, city)
+            .options(*_LIST_DEFERRED)
+            .order_by(Devotee.id)
+            .yield_per(_STREAM_BATCH_SIZE)
+        )
+        yield from query
+
+    @staticmethod
+    def _location_query(db: Session, country: str | None, state: str | None, city: str | None):
+        """Build the case-insensitive location filter shared by the location lookups."""
+        query = db.query(Devotee)
         if country:
             query = query.filter(func.lower(Devotee.country) == country.lower())
         if state:
             query = query.filter(func.lower(Devotee.state_province) == state.lower())
         if city:
             query = query.filter(func.lower(Devotee.city) == city.lower())
+        return query
 
-        return query.order_by(Devotee.legal_name).all()
-
-    def get_devotees_by_spiritual_master(self, db: Session, spiritual_master: str) -> list[Devotee]:
-        """Get devotees by spiritual master with optimized query."""
-        return (
+    def get_devotees_by_spiritual_master(
+        self,
+        db: Session,
+        spiritual_master: str,
+        limit: int = 100,
+        after_id: int | None = None,
+    ) -> tuple[list[Devotee], int | None]:
+        """Get one page of devotees by spiritual master using keyset pagination."""
+        query = (
             db.query(Devotee)
+            .options(_SUMMARY_COLUMNS)
             .filter(func.lower(Devotee.spiritual_master) == spiritual_master.lower())
-            .order_by(Devotee.legal_name)
-            .all()
         )
+        return self._keyset_page(query, limit, after_id)
+
+    def _keyset_page(
+        self, query, limit: int, after_id: int | None
+    ) -> tuple[list[Devotee], int | None]:
+        """
+        Fetch one id-ordered page without OFFSET.
+
+        Seeks past ``after_id`` on the primary key and reads one extra row to
+        detect whether another page exists, so cost stays O(limit) however
+        deep the caller pages.
+        """
+        if after_id is not None:
+            query = query.filter(Devotee.id > after_id)
+
+        rows = query.order_by(Devotee.id).limit(limit + 1).all()
+        if len(rows) > limit:
+            rows = rows[:limit]
+            return rows, rows[-1].id
+        return rows, None
 
     # Authentication methods
-    async def create_simple_unverified_devotee(self, devotee_data) -> Devotee:
+    async def create_simple_unverified_devotee(
+        self, devotee_data, background: BackgroundTasks | None = None
+    ) -> Devotee:
         """Create an unverified devotee with minimal information and send verification email."""
-        # Check if devotee already exists
-        existing_devotee = (
-            self.db.query(Devotee).filter(Devotee.email == devotee_data.email.lower()).first()
-        )
+        # Check if devotee already exists. The session is not thread-safe, so
+        # the lookup stays on this thread; only the hashing is offloaded
+        existing_devotee = self.get_devotee_by_email(self.db, devotee_data.email)
 
         if existing_devotee:
-            if existing_devotee.email_verified is True:
-                raise StandardHTTPException(
-                    status_code=status.HTTP_409_CONFLICT,
-                    message="A verified devotee with this email already exists",
-                    success=False,
-                    data=None,
-                )
-            # Resend verification email for unverified devotee
-            await self._send_verification_email(existing_devotee)
-            raise StandardHTTPException(
-                status_code=status.HTTP_409_CONFLICT,
-                message="Devotee exists but is not verified. Verification email sent again.",
-                success=False,
-                data=None,
-            )
-
-        # Generate secure verification token
-        verification_token = secrets.token_urlsafe(32)
-        verification_expires = datetime.now(UTC) + timedelta(hours=24)
+            if existing_devotee.email_verified:
+                raise _http_409("A verified devotee with this email already exists")
+            # Resend verification email for unverified devotee with a fresh token
+            verification_token = self._issue_verification_token(existing_devotee)
+            self.db.commit()
+            await self._send_verification_email(existing_devotee, verification_token, background)
+            raise _http_409("Devotee exists but is not verified. Verification email sent again.")
 
         # Create new devotee with minimal information (unverified)
+        password_hash = await asyncio.to_thread(get_password_hash, devotee_data.password)
         new_devotee = Devotee(
             # Basic authentication fields
-            email=devotee_data.email.lower(),
-            password_hash=get_password_hash(devotee_data.password),
+            email=devotee_data.email,
+            password_hash=password_hash,
             # Minimal profile information
             legal_name=devotee_data.legal_name.strip(),
-            # Verification fields
             email_verified=False,
-            verification_token=verification_token,
-            verification_expires=verification_expires,
             # Set default spiritual information
             initiation_status=InitiationStatus.ASPIRING,
             chanting_number_of_rounds=16,
         )
 
+        verification_token = self._issue_verification_token(new_devotee)
+
         try:
             self.db.add(new_devotee)
-            self.db.flush()  # Get the ID without committing
-
-            # Send verification email
-            await self._send_verification_email(new_devotee)
-
             self.db.commit()
-            self.db.refresh(new_devotee)
-
-            logger.info(f"Created simple unverified devotee with email: {devotee_data.email}")
-            return new_devotee
+            auth_security.forget_missing_email(new_devotee.email)
+            _devotees_changed()
 
         except Exception as e:
             self.db.rollback()
             logger.error(f"Failed to create simple unverified devotee: {e!s}")
-            raise StandardHTTPException(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                message="Failed to create devotee account",
-                success=False,
-                data=None,
-            ) from None
-
-    async def verify_devotee_email(self, token: str) -> str:
+            raise _http_500("Failed to create devotee account") from None
+
+        # Send verification email once the account is committed
+        await self._send_verification_email(new_devotee, verification_token, background)
+
+        logger.info(f"Created simple unverified devotee with email: {devotee_data.email}")
+        return new_devotee
+
+    async def verify_devotee_email(
+        self, token: str, background: BackgroundTasks | None = None
+    ) -> str:
         """Verify devotee's email using verification token.
 
         Returns:
             str: The verified email address
         """
-        devotee = self.db.query(Devotee).filter(Devotee.verification_token == token).first()
+        token_hash = token_manager.hash_token(token)
+        devotee = _first_devotee(
+            self.db,
+            lambda_stmt(
+                lambda: select(Devotee).where(Devotee.verification_token_hash == token_hash)
+            ),
+        )
 
         if not devotee:
-            raise StandardHTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                message="Invalid or expired verification token",
-                success=False,
-                data=None,
-            )
+            raise _http_404("Invalid or expired verification token")
 
         # Check if already verified
-        if getattr(devotee, "email_verified", False) is True:
-            raise StandardHTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                message="Email is already verified",
-                success=False,
-                data=None,
-            )
+        if devotee.email_verified:
+            raise _http_400("Email is already verified")
 
-        # Check if token is expired with proper timezone handling
+        # Check if token is expired
         if devotee.verification_expires is not None:
-            current_time = datetime.now(UTC)
-            expires_at = devotee.verification_expires
-
-            # Handle timezone awareness - if tzinfo is None, assume UTC
-            if hasattr(expires_at, "tzinfo") and expires_at.tzinfo is None:
-                expires_at = expires_at.replace(tzinfo=UTC)
-
-            if expires_at < current_time:
-                raise StandardHTTPException(
-                    status_code=status.HTTP_400_BAD_REQUEST,
-                    message="Verification token has expired",
-                    success=False,
-                    data=None,
-                )
+            if _as_utc(devotee.verification_expires) < datetime.now(UTC):
+                raise _http_400("Verification token has expired")
 
         try:
             # Store email before marking as verified
             verified_email = devotee.email
 
-            # Mark devotee as verified
-            devotee.email_verified = True
-            devotee.verification_token = None
-            devotee.verification_expires = None
-
-            self.db.commit()
-
-            # Send success email
-            try:
-                email_service = GmailService()
-                await email_service.send_email_verification_success(
-                    verified_email, devotee.legal_name
+            # Mark devotee as verified with a single UPDATE of just these
+            # columns; the in-session devotee is synchronized in place
+            self.db.execute(
+                update(Devotee)
+                .where(Devotee.id == devotee.id)
+                .values(
+                    email_verified=True,
+                    verification_token_hash=None,
+                    verification_expires=None,
                 )
-            except Exception as email_error:
-                logger.warning(f"Failed to send verification success email: {email_error}")
-                # Continue with verification even if email fails
-
-            logger.info(f"Verified devotee email: {verified_email}")
-            return verified_email
+            )
+            self.db.commit()
+            _devotees_changed()
 
         except Exception as e:
             logger.error(f"Failed to verify devotee email: {e!s}")
             self.db.rollback()
-            raise StandardHTTPException(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                message="Failed to verify email",
-                success=False,
-                data=None,
-            ) from None
-
-    async def resend_verification_email(self, email: str) -> bool:
+            raise _http_500("Failed to verify email") from None
+
+        # Send success email; verification stands even if it fails
+        await _queue_email(
+            background,
+            "send_email_verification_success",
+            email=verified_email,
+            user_name=devotee.legal_name,
+        )
+
+        logger.info(f"Verified devotee email: {verified_email}")
+        return verified_email
+
+    async def resend_verification_email(
+        self, email: str, background: BackgroundTasks | None = None
+    ) -> bool:
         """Resend verification email to devotee."""
-        devotee = self.get_devotee_by_email(self.db, email)
+        devotee = self._get_devotee_by_email_cached_miss(email)
         if not devotee:
-            raise StandardHTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                message="Devotee not found",
-                success=False,
-                data=None,
-            )
+            raise _http_404("Devotee not found")
 
-        # Check if already verified - ensure we get the actual boolean value
-        already_verified = getattr(devotee, "email_verified", False)
-        if already_verified is True:
-            raise StandardHTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                message="Email is already verified",
-                success=False,
-                data=None,
-            )
+        # Check if already verified
+        if devotee.email_verified:
+            raise _http_400("Email is already verified")
 
         try:
-            # Generate new verification token
-            devotee.verification_token = secrets.token_urlsafe(32)
-            devotee.verification_expires = datetime.now(UTC) + timedelta(hours=24)
-
-            await self._send_verification_email(devotee)
-
+            verification_token = self._issue_verification_token(devotee)
             self.db.commit()
-            logger.info(f"Resent verification email to: {email}")
-            return True
 
         except Exception as e:
             self.db.rollback()
             logger.error(f"Failed to resend verification email: {e!s}")
-            raise StandardHTTPException(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                message="Failed to resend verification email",
-                success=False,
-                data=None,
-            )
+            raise _http_500("Failed to resend verification email") from None
+
+        await self._send_verification_email(devotee, verification_token, background)
+
+        logger.info(f"Resent verification email to: {email}")
+        return True
+
+    def _get_devotee_by_email_cached_miss(self, email: str) -> Devotee | None:
+        """Look up a devotee by email, short-circuiting recently missed addresses."""
+        if auth_security.is_email_known_missing(email):
+            return None
+        devotee = self.get_devotee_by_email(self.db, email)
+        if not devotee:
+            auth_security.remember_missing_email(email)
+        return devotee
 
-    async def _send_verification_email(self, devotee: Devotee):
+    @staticmethod
+    def _issue_verification_token(devotee: Devotee) -> str:
+        """Give ``devotee`` a new verification token; only its hash is stored."""
+        token = token_manager.generate_secure_token()
+        devotee.verification_token_hash = token_manager.hash_token(token)
+        devotee.verification_expires = datetime.now(UTC) + _VERIFICATION_TTL
+        return token
+
+    async def _send_verification_email(
+        self, devotee: Devotee, token: str, background: BackgroundTasks | None = None
+    ) -> None:
         """Send verification email to devotee."""
-        email_service = GmailService()
-        await email_service.send_email_verification(
+        await _queue_email(
+            background,
+            "send_email_verification",
             email=devotee.email,
             user_name=devotee.legal_name,
-            verification_token=devotee.verification_token,
+            verification_token=token,
         )
 
-    async def send_password_reset_email(self, email: str) -> bool:
+    async def send_password_reset_email(
+        self, email: str, background: BackgroundTasks | None = None
+    ) -> bool:
         """Send password reset email to devotee."""
-        devotee = self.get_devotee_by_email(self.db, email)
+        devotee = self._get_devotee_by_email_cached_miss(email)
         if not devotee:
-            raise StandardHTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                message="User not found",
-                success=False,
-                data=None,
-            )
+            raise _http_404("User not found")
 
-        if getattr(devotee, "email_verified", False) is not True:
-            raise StandardHTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                message="Email must be verified before password reset",
-                success=False,
-                data=None,
-            )
+        if not devotee.email_verified:
+            raise _http_400("Email must be verified before password reset")
 
         try:
             # Generate reset token
-            devotee.password_reset_token = secrets.token_urlsafe(32)
-            devotee.password_reset_expires = datetime.now(UTC) + timedelta(hours=1)
-
-            # Send reset email
-            email_service = GmailService()
-            await email_service.send_password_reset_email(
-                email=devotee.email,
-                reset_token=devotee.password_reset_token,
-                user_name=devotee.legal_name,
-            )
+            reset_token = token_manager.generate_secure_token()
+            devotee.password_reset_token_hash = token_manager.hash_token(reset_token)
+            devotee.password_reset_expires = datetime.now(UTC) + _RESET_TTL
 
             self.db.commit()
-            logger.info(f"Sent password reset email to: {email}")
-            return True
 
         except Exception as e:
             self.db.rollback()
             logger.error(f"Failed to send password reset email: {e!s}")
-            raise StandardHTTPException(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                message="Failed to send password reset email",
-                success=False,
-                data=None,
-            ) from None
-
-    def reset_password_with_token(self, token: str, new_password: str) -> bool:
+            raise _http_500("Failed to send password reset email") from None
+
+        await _queue_email(
+            background,
+            "send_password_reset_email",
+            email=devotee.email,
+            reset_token=reset_token,
+            user_name=devotee.legal_name,
+        )
+
+        logger.info(f"Sent password reset email to: {email}")
+        return True
+
+    async def reset_password_with_token(self, token: str, new_password: str) -> bool:
         """Reset devotee's password using reset token."""
-        devotee = self.db.query(Devotee).filter(Devotee.password_reset_token == token).first()
+        token_hash = token_manager.hash_token(token)
+        devotee = _first_devotee(
+            self.db,
+            lambda_stmt(
+                lambda: select(Devotee).where(Devotee.password_reset_token_hash == token_hash)
+            ),
+        )
 
         if not devotee:
-            raise StandardHTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                message="Invalid reset token",
-                success=False,
-                data=None,
-            )
+            raise _http_404("Invalid reset token")
 
         # Check if token is expired
-        # Convert to timezone-aware if needed (MySQL doesn't store timezone info)
-        expires_time = devotee.password_reset_expires
-        if expires_time.tzinfo is None:
-            expires_time = expires_time.replace(tzinfo=UTC)
-
-        if expires_time < datetime.now(UTC):
-            raise StandardHTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                message="Reset token has expired",
-                success=False,
-                data=None,
-            )
+        if _as_utc(devotee.password_reset_expires) < datetime.now(UTC):
+            raise _http_400("Reset token has expired")
 
         try:
             # Update password and clear reset token
-            devotee.password_hash = get_password_hash(new_password)
-            devotee.password_reset_token = None
+            devotee.password_hash = await asyncio.to_thread(get_password_hash, new_password)
+            devotee.password_reset_token_hash = None
             devotee.password_reset_expires = None
 
             self.db.commit()
@@ -807,26 +1392,35 @@ class DevoteeService:
         except Exception as e:
             self.db.rollback()
             logger.error(f"Failed to reset password: {e!s}")
-            raise StandardHTTPException(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                message="Failed to reset password",
-                success=False,
-                data=None,
-            ) from None
-
-    def admin_reset_password(self, devotee_id: int, new_password: str, admin_id: int) -> bool:
-        """Admin function to reset any devotee's password."""
-        devotee = self.get_devotee_by_id(self.db, devotee_id)
+            raise _http_500("Failed to reset password") from None
+
+    def _resolve_devotee(self, devotee_id: int, devotee: Devotee | None) -> Devotee | None:
+        """Return the prefetched devotee, or load it by ID when none was given."""
+        if devotee is None:
+            return self.get_devotee_by_id(self.db, devotee_id)
+        if devotee.id != devotee_id:
+            raise ValueError(f"Prefetched devotee {devotee.id} does not match ID {devotee_id}")
+        return devotee
+
+    async def admin_reset_password(
+        self,
+        devotee_id: int,
+        new_password: str,
+        admin_id: int,
+        *,
+        devotee: Devotee | None = None,
+    ) -> bool:
+        """
+        Admin function to reset any devotee's password.
+
+        Pass ``devotee`` when the caller already loaded it to skip the lookup.
+        """
+        devotee = self._resolve_devotee(devotee_id, devotee)
         if not devotee:
-            raise StandardHTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                message="Devotee not found",
-                success=False,
-                data=None,
-            )
+            raise _http_404("Devotee not found")
 
         try:
-            devotee.password_hash = get_password_hash(new_password)
+            devotee.password_hash = await asyncio.to_thread(get_password_hash, new_password)
 
             self.db.commit()
             logger.info(f"Admin {admin_id} reset password for devotee {devotee_id}")
@@ -835,32 +1429,74 @@ class DevoteeService:
         except Exception as e:
             self.db.rollback()
             logger.error(f"Failed to admin reset password: {e!s}")
-            raise StandardHTTPException(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                message="Failed to reset password",
-                success=False,
-                data=None,
-            ) from None
-
-    def authenticate_devotee(self, email: str, password: str) -> Devotee | None:
+            raise _http_500("Failed to reset password") from None
+
+    async def authenticate_devotee(self, email: str, password: str) -> Devotee | None:
         """Authenticate devotee with email and password."""
-        devotee = self.get_devotee_by_email(self.db, email)
-        if not devotee:
+        # Load only the credential columns; the full row is fetched on success
+        credentials = (
+            self.db.query(Devotee.id, Devotee.password_hash, Devotee.email_verified)
+            .filter(Devotee.email == email)
+            .first()
+        )
+        if not credentials:
+            # Spend the same bcrypt time as a real check so response timing
+            # doesn't reveal whether the email is registered
+            await asyncio.to_thread(verify_password, password, _DUMMY_PASSWORD_HASH)
             return None
 
-        if getattr(devotee, "email_verified", False) is not True:
-            raise StandardHTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                message="Email must be verified before login",
-                success=False,
-                data=None,
-            )
+        if not credentials.email_verified:
+            raise _http_400("Email must be verified before login")
 
-        if not verify_password(password, devotee.password_hash):
+        # Password hashing is deliberately slow; keep it off the event loop
+        if not await asyncio.to_thread(verify_password, password, credentials.password_hash):
             return None
 
+        devotee = self.db.get(Devotee, credentials.id)
+        if password_needs_rehash(credentials.password_hash):
+            # Upgrade legacy bcrypt hashes now that we hold the plaintext
+            devotee.password_hash = await asyncio.to_thread(get_password_hash, password)
+            self.db.commit()
         return devotee
 
+    @staticmethod
+    def _existing_files_size(devotee: Devotee) -> int:
+        """Return the combined size in bytes of a devotee's uploaded files."""
+        return devotee.total_upload_bytes or 0
+
+    @staticmethod
+    def _check_file_count(existing_count: int, new_count: int) -> None:
+        """
+        Raise if adding files would exceed the per-user file limit.
+
+        Args:
+            existing_count: Number of files the devotee already has
+            new_count: Number of files being added
+
+        Raises:
+            HTTPException: If the combined count exceeds the limit
+        """
+        if existing_count + new_count > _MAX_FILES:
+            raise _http_400(
+                f"Maximum {_MAX_FILES} files allowed. You have {existing_count} existing files."
+            )
+
+    @staticmethod
+    def _check_total_file_size(total_size: int) -> None:
+        """
+        Raise if a cumulative upload size exceeds the per-user limit.
+
+        Args:
+            total_size: Combined size in bytes of existing and new files
+
+        Raises:
+            HTTPException: If total size exceeds limit
+        """
+        if total_size > _MAX_UPLOAD_BYTES:
+            raise _http_400(
+                f"Total file size ({total_size / 1024 / 1024:.2f}MB) would exceed maximum allowed ({_MAX_UPLOAD_MB}MB). Please delete some files first."
+            )
+
     def _validate_total_file_size(self, devotee: Devotee, new_file_size: int) -> None:
         """
         Validate that adding a new file won't exceed total size limit.
@@ -872,21 +1508,73 @@ class DevoteeService:
         Raises:
             HTTPException: If total size would exceed limit
         """
-        total_size = new_file_size
+        self._check_total_file_size(self._existing_files_size(devotee) + new_file_size)
+
+    async def _upload_many(
+        self,
+        storage_service: StorageService,
+        files_with_purposes: list[tuple[UploadFile, str]],
+        devotee: Devotee,
+    ) -> list[dict]:
+        """
+        Upload several files to GCS concurrently.
+
+        If any upload fails, the ones that succeeded are discarded before the
+        error is raised, so a partial batch leaves no orphaned objects.
+
+        Args:
+            storage_service: Storage service to upload with
+            files_with_purposes: (file, purpose) pairs to upload
+            devotee: Devotee the files belong to
+
+        Returns:
+            list[dict]: File metadata in the same order as the input
+
+        Raises:
+            HTTPException: The first upload failure, after all uploads finish
+        """
+        semaphore = asyncio.Semaphore(_MAX_FILES)
 
-        # Add size of existing uploaded files
-        if devotee.uploaded_files:
-            for file_info in devotee.uploaded_files:
-                total_size += file_info.get("size", 0)
+        async def _upload(uploaded_file: UploadFile, purpose: str) -> dict:
+            async with semaphore:
+                return await storage_service.upload_file_async(
+                    file=uploaded_file, user_id=devotee.id, file_purpose=purpose
+                )
 
-        # Check against limit
-        if total_size > settings.max_upload_size_bytes:
-            raise StandardHTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                message=f"Total file size ({total_size / 1024 / 1024:.2f}MB) would exceed maximum allowed ({settings.max_upload_size_mb}MB). Please delete some files first.",
-                success=False,
-                data=None,
+        results = await asyncio.gather(
+            *(_upload(f, purpose) for f, purpose in files_with_purposes),
+            return_exceptions=True,
+        )
+        failures = [result for result in results if isinstance(result, BaseException)]
+        if failures:
+            await self._discard_uploads(
+                devotee, [result for result in results if not isinstance(result, BaseException)]
             )
+            raise failures[0]
+        return results
+
+    async def _discard_uploads(self, devotee: Devotee, uploaded_metadata: list[dict]) -> None:
+        """
+        Best-effort removal of GCS objects uploaded for a failed profile save.
+
+        Objects the devotee row still points at are kept, since an upload may
+        have replaced a file of the same name.
+        """
+        files: list[dict] = devotee.uploaded_files or []  # type: ignore[assignment]
+        referenced = {file_info.get("gcs_path") for file_info in files}
+        referenced.add(devotee.profile_photo_path)
+        storage_service = get_storage_service()
+        for file_metadata in uploaded_metadata:
+            if file_metadata["gcs_path"] in referenced:
+                continue
+            try:
+                await asyncio.to_thread(
+                    storage_service.delete_file, devotee.id, Path(file_metadata["gcs_path"]).name
+                )
+            except Exception as e:
+                logger.warning(
+                    "Failed to remove orphaned upload %s: %s", file_metadata["gcs_path"], e
+                )
 
     async def complete_devotee_profile(
         self,
@@ -894,6 +1582,8 @@ class DevoteeService:
         profile_data: dict,
         profile_photo: UploadFile | None = None,
         uploaded_files: list[UploadFile] | None = None,
+        *,
+        devotee: Devotee | None = None,
     ) -> Devotee:
         """
         Complete devotee profile after email verification with file uploads.
@@ -903,6 +1593,7 @@ class DevoteeService:
             profile_data: Dictionary of profile fields to update
             profile_photo: Optional profile photo
             uploaded_files: Optional list of document files (max 5)
+            devotee: Already-loaded devotee for ``user_id``, if the caller has it
 
         Returns:
             Devotee: The updated devotee object
@@ -910,101 +1601,107 @@ class DevoteeService:
         Raises:
             HTTPException: For validation errors or save failures
         """
-        devotee = self.get_devotee_by_id(self.db, user_id)
+        devotee = self._resolve_devotee(user_id, devotee)
         if not devotee:
-            raise StandardHTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                message="Devotee not found",
-                success=False,
-                data=None,
-            )
+            raise _http_404("Devotee not found")
 
         # Check if email is verified
-        if getattr(devotee, "email_verified", False) is not True:
-            raise StandardHTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                message="Email must be verified before completing profile",
-                success=False,
-                data=None,
-            )
+        if not devotee.email_verified:
+            raise _http_400("Email must be verified before completing profile")
 
+        uploaded_metadata: list[dict] = []
         try:
-            # Update devotee with profile data (excluding file fields)
-            for field, value in profile_data.items():
-                if hasattr(devotee, field) and field not in [
-                    "profile_photo_path",
-                    "uploaded_files",
-                ]:
-                    setattr(devotee, field, value)
-
-            # Handle profile photo upload
-            if profile_photo:
-                storage_service = StorageService()
-                photo_metadata = storage_service.upload_file(
-                    file=profile_photo, user_id=user_id, file_purpose="profile_photo"
-                )
-                devotee.profile_photo_path = photo_metadata["gcs_path"]
-                logger.info(f"Saved profile photo for user {user_id}")
-
-            # Handle document uploads
-            if uploaded_files:
-                # Validate file count
+            # Nothing may hit the database until the single UPDATE below, even
+            # when the caller's session has autoflush enabled
+            with self.db.no_autoflush:
+                # Collect profile data (excluding file fields) for a single UPDATE
+                updates = {
+                    field: value
+                    for field, value in profile_data.items()
+                    if field in _DEVOTEE_UPDATABLE_COLUMNS
+                }
+
+                # Validate documents before uploading anything
                 existing_files = devotee.uploaded_files or []
-                total_files = len(existing_files) + len(uploaded_files)
-
-                if total_files > settings.max_files_per_user:
-                    raise StandardHTTPException(
-                        status_code=status.HTTP_400_BAD_REQUEST,
-                        message=f"Maximum {settings.max_files_per_user} files allowed. You have {len(existing_files)} existing files.",
-                        success=False,
-                        data=None,
+                files_with_purposes = []
+                if uploaded_files:
+                    # Validate file count
+                    self._check_file_count(len(existing_files), len(uploaded_files))
+
+                    # Validate total size
+                    total_size = self._existing_files_size(devotee)
+                    for idx, uploaded_file in enumerate(uploaded_files, 1):
+                        file_size = _fast_file_size(uploaded_file)
+                        total_size += file_size
+                        self._check_total_file_size(total_size)
+
+                        # Extract purpose from filename or use default
+                        purpose = (
+                            _purpose_from_filename(uploaded_file.filename)
+                            if uploaded_file.filename
+                            else f"document_{idx}"
+                        )
+                        files_with_purposes.append((uploaded_file, purpose))
+
+                # End the read transaction so no connection or snapshot is held
+                # while the uploads run
+                self.db.commit()
+
+                # Upload the profile photo and all documents to GCS concurrently
+                if profile_photo:
+                    files_with_purposes.insert(0, (profile_photo, "profile_photo"))
+                if files_with_purposes:
+                    uploaded_metadata = await self._upload_many(
+                        get_storage_service(), files_with_purposes, devotee
                     )
 
-                # Save each file and collect metadata
-                storage_service = StorageService()
-                new_files_metadata = []
-                for idx, uploaded_file in enumerate(uploaded_files, 1):
-                    # Validate total size before saving
-                    uploaded_file.file.seek(0, 2)
-                    file_size = uploaded_file.file.tell()
-                    uploaded_file.file.seek(0)
-
-                    self._validate_total_file_size(devotee, file_size)
-
-                    # Extract purpose from filename or use default
-                    purpose = (
-                        Path(uploaded_file.filename).stem
-                        if uploaded_file.filename
-                        else f"document_{idx}"
-                    )
-
-                    # Save file to GCS
-                    file_metadata = storage_service.upload_file(
-                        file=uploaded_file, user_id=user_id, file_purpose=purpose
-                    )
-                    new_files_metadata.append(file_metadata)
-
-                # Update devotee's uploaded_files array
-                devotee.uploaded_files = existing_files + new_files_metadata
-                logger.info(f"Saved {len(new_files_metadata)} document(s) for user {user_id}")
-
+                    document_metadata = uploaded_metadata
+                    if profile_photo:
+                        photo_metadata, *document_metadata = uploaded_metadata
+                        updates["profile_photo_path"] = photo_metadata["gcs_path"]
+                        logger.info("Saved profile photo for user %s", user_id)
+
+                    if document_metadata:
+                        # Re-read the file list under a row lock: a concurrent
+                        # save may have appended files while the uploads ran
+                        current_files, current_bytes = (
+                            self.db.query(Devotee.uploaded_files, Devotee.total_upload_bytes)
+                            .filter(Devotee.id == devotee.id)
+                            .with_for_update()
+                            .one()
+                        )
+                        current_files = current_files or []
+                        new_bytes = sum(
+                            file_metadata["size"] for file_metadata in document_metadata
+                        )
+                        self._check_file_count(len(current_files), len(document_metadata))
+                        self._check_total_file_size((current_bytes or 0) + new_bytes)
+
+                        # Update devotee's uploaded_files array
+                        updates["uploaded_files"] = current_files + document_metadata
+                        updates["total_upload_bytes"] = (current_bytes or 0) + new_bytes
+                        logger.info(
+                            "Saved %s document(s) for user %s", len(document_metadata), user_id
+                        )
+
+            if updates:
+                # Set updated_at here so the in-session devotee needs no refresh
+                updates["updated_at"] = datetime.now(UTC)
+                self.db.execute(update(Devotee).where(Devotee.id == devotee.id).values(**updates))
             self.db.commit()
-            self.db.refresh(devotee)
-            logger.info(f"Completed profile for devotee: {devotee.email}")
+            _devotees_changed()
+            logger.info("Completed profile for devotee: %s", devotee.email)
             return devotee
 
         except HTTPException:
             self.db.rollback()
+            await self._discard_uploads(devotee, uploaded_metadata)
             raise
         except Exception as e:
             self.db.rollback()
-            logger.error(f"Failed to complete devotee profile: {e!s}")
-            raise StandardHTTPException(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                message="Failed to complete profile",
-                success=False,
-                data=None,
-            ) from None
+            logger.error("Failed to complete devotee profile: %s", e)
+            await self._discard_uploads(devotee, uploaded_metadata)
+            raise _http_500("Failed to complete profile") from None
 
 
 # Note: Global service instance removed due to db session requirement
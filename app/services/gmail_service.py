@@ -3,6 +3,7 @@ Gmail API service for sending emails using OAuth2.
 More reliable than SMTP and works on platforms that block SMTP ports.
 """
 
+import asyncio
 import base64
 import logging
 import pickle  # nosec B403 - Required for Google OAuth2 credentials
@@ -215,7 +216,10 @@ class GmailService:
 
             message = self._create_message(to, subject, html_content)
 
-            self.service.users().messages().send(userId="me", body=message).execute()
+            # The Google API client blocks on HTTP; keep it off the event loop
+            await asyncio.to_thread(
+                self.service.users().messages().send(userId="me", body=message).execute
+            )
 
             logger.info(f"Email sent successfully to {to}")
             return True
@@ -5,18 +5,20 @@ Provides simple, clean interface for uploading, downloading, and managing
 user files in GCS with descriptive filenames.
 """
 
+import asyncio
 import json
 import logging
 import mimetypes
 import os
 import re
+from collections.abc import Iterator
 from datetime import UTC, datetime
 from pathlib import Path
 from uuid import uuid4
 
 from fastapi import HTTPException, UploadFile, status
 from google.cloud import storage
-from google.cloud.exceptions import GoogleCloudError
+from google.cloud.exceptions import GoogleCloudError, NotFound
 from google.oauth2 import service_account
 
 from app.core.config import settings
@@ -24,6 +26,24 @@ from app.core.responses import StandardHTTPException
 
 logger = logging.getLogger(__name__)
 
+# Resumable uploads (files over 8 MB) are sent in chunks of this size, so a
+# large file never sits in memory all at once. Must be a multiple of 256 KiB.
+_UPLOAD_CHUNK_SIZE = 1024 * 1024
+
+# Per-file limits, read once; settings are fixed for the life of the process
+_MAX_FILE_MB = settings.max_file_size_mb
+_MAX_FILE_BYTES = _MAX_FILE_MB * 1024 * 1024
+_ALLOWED_EXTENSIONS = tuple(
+    settings.allowed_image_extensions + settings.allowed_document_extensions
+)
+
+# Filename sanitization patterns, compiled once instead of per call
+_UNSAFE_FILENAME_CHARS = re.compile(r"[^a-z0-9._-]+")
+_UNDERSCORE_RUNS = re.compile(r"_{2,}")
+
+# Downloads are streamed back to the client in pieces of this size
+_DOWNLOAD_CHUNK_SIZE = 1024 * 1024
+
 
 class StorageService:
     """
@@ -54,9 +74,9 @@ class StorageService:
                 logger.info("Initialized StorageService with Application Default Credentials")
 
             self.bucket = self.client.bucket(settings.gcs_bucket_name)
-            logger.info(f"Initialized StorageService for bucket: {settings.gcs_bucket_name}")
+            logger.info("Initialized StorageService for bucket: %s", settings.gcs_bucket_name)
         except Exception as e:
-            logger.error(f"Failed to initialize StorageService: {e}")
+            logger.error("Failed to initialize StorageService: %s", e)
             raise
 
     def _sanitize_filename(self, filename: str) -> str:
@@ -79,36 +99,41 @@ class StorageService:
         filename = filename.replace(" ", "_")
 
         # Remove special characters except underscores, hyphens, dots
-        filename = re.sub(r"[^a-z0-9._-]", "", filename)
+        filename = _UNSAFE_FILENAME_CHARS.sub("", filename)
 
         # Remove multiple consecutive underscores
-        filename = re.sub(r"_+", "_", filename)
+        filename = _UNDERSCORE_RUNS.sub("_", filename)
 
         # Remove leading/trailing underscores and dots
         filename = filename.strip("_.")
 
         return filename
 
-    def _validate_file(self, file: UploadFile) -> None:
+    def _validate_file(self, file: UploadFile) -> int:
         """
         Validate file size and extension.
 
         Args:
             file: FastAPI UploadFile object
 
+        Returns:
+            int: File size in bytes
+
         Raises:
             HTTPException: If validation fails
         """
-        # Check file size
-        file.file.seek(0, 2)  # Seek to end
-        file_size = file.file.tell()
-        file.file.seek(0)  # Reset to beginning
+        # Check file size; Starlette records it while spooling the upload, so
+        # only seek to the end for files built without one
+        file_size = file.size
+        if file_size is None:
+            file.file.seek(0, 2)  # Seek to end
+            file_size = file.file.tell()
+            file.file.seek(0)  # Reset to beginning
 
-        max_size = settings.max_file_size_mb * 1024 * 1024
-        if file_size > max_size:
+        if file_size > _MAX_FILE_BYTES:
             raise StandardHTTPException(
                 status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
-                message=f"File size ({file_size / 1024 / 1024:.2f}MB) exceeds maximum allowed size ({settings.max_file_size_mb}MB)",
+                message=f"File size ({file_size / 1024 / 1024:.2f}MB) exceeds maximum allowed size ({_MAX_FILE_MB}MB)",
                 success=False,
                 data=None,
             )
@@ -116,18 +141,16 @@ class StorageService:
         # Check file extension
         if file.filename:
             file_ext = Path(file.filename).suffix.lower()
-            allowed_extensions = (
-                settings.allowed_image_extensions + settings.allowed_document_extensions
-            )
-
-            if file_ext not in allowed_extensions:
+            if file_ext not in _ALLOWED_EXTENSIONS:
                 raise StandardHTTPException(
                     status_code=status.HTTP_400_BAD_REQUEST,
-                    message=f"File type {file_ext} not allowed. Allowed types: {', '.join(allowed_extensions)}",
+                    message=f"File type {file_ext} not allowed. Allowed types: {', '.join(_ALLOWED_EXTENSIONS)}",
                     success=False,
                     data=None,
                 )
 
+        return file_size
+
     def _get_content_type(self, filename: str) -> str:
         """
         Detect content type from filename extension.
@@ -164,7 +187,7 @@ class StorageService:
         """
         try:
             # Validate file
-            self._validate_file(file)
+            file_size = self._validate_file(file)
 
             # Get file extension
             file_ext = Path(file.filename).suffix.lower() if file.filename else ""
@@ -185,31 +208,31 @@ class StorageService:
             # Create GCS path: {user_id}/{filename}
             gcs_path = f"{user_id}/{filename}"
 
-            # Get file size
-            file.file.seek(0, 2)
-            file_size = file.file.tell()
-            file.file.seek(0)
-
             # Detect content type
             content_type = self._get_content_type(filename)
 
             # Create blob and upload
-            blob = self.bucket.blob(gcs_path)
+            blob = self.bucket.blob(gcs_path, chunk_size=_UPLOAD_CHUNK_SIZE)
 
-            # Set metadata
+            # Set metadata; the same timestamp is returned to the caller
+            uploaded_at = datetime.now(UTC).isoformat()
             blob.metadata = {
                 "original_filename": file.filename or filename,
                 "uploaded_by": str(user_id),
-                "upload_date": datetime.now(UTC).isoformat(),
+                "upload_date": uploaded_at,
                 "purpose": sanitized_purpose,
             }
 
-            # Upload file
-            file_content = file.file.read()
-            blob.upload_from_string(file_content, content_type=content_type)
+            # Stream the upload from the spooled file instead of copying it into memory;
+            # the known size lets small files go up in a single multipart request
+            blob.upload_from_file(file.file, rewind=True, size=file_size, content_type=content_type)
 
             logger.info(
-                f"Uploaded file for user {user_id}: {gcs_path} ({file_size} bytes, {content_type})"
+                "Uploaded file for user %s: %s (%s bytes, %s)",
+                user_id,
+                gcs_path,
+                file_size,
+                content_type,
             )
 
             # Return metadata
@@ -218,14 +241,14 @@ class StorageService:
                 "gcs_path": gcs_path,
                 "size": file_size,
                 "content_type": content_type,
-                "uploaded_at": datetime.now(UTC).isoformat(),
+                "uploaded_at": uploaded_at,
                 "purpose": sanitized_purpose,
             }
 
         except HTTPException:
             raise
         except GoogleCloudError as e:
-            logger.error(f"GCS error uploading file for user {user_id}: {e}")
+            logger.error("GCS error uploading file for user %s: %s", user_id, e)
             raise StandardHTTPException(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
                 message="Failed to upload file to cloud storage. Please try again.",
@@ -233,7 +256,7 @@ class StorageService:
                 data=None,
             )
         except Exception as e:
-            logger.error(f"Unexpected error uploading file for user {user_id}: {e}")
+            logger.error("Unexpected error uploading file for user %s: %s", user_id, e)
             raise StandardHTTPException(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
                 message="Failed to upload file. Please try again.",
@@ -241,16 +264,45 @@ class StorageService:
                 data=None,
             )
 
-    def download_file(self, user_id: int, filename: str) -> tuple[bytes, str]:
+    async def upload_file_async(self, file: UploadFile, user_id: int, file_purpose: str) -> dict:
+        """
+        Upload file to GCS without blocking the event loop.
+
+        Runs :meth:`upload_file` on a worker thread so several uploads can be
+        in flight at once from async handlers.
+
+        Args:
+            file: FastAPI UploadFile object
+            user_id: User ID for path organization
+            file_purpose: Descriptive name (e.g., 'profile_photo', 'passport')
+
+        Returns:
+            dict: File metadata, as returned by :meth:`upload_file`
+        """
+        return await asyncio.to_thread(
+            self.upload_file, file=file, user_id=user_id, file_purpose=file_purpose
+        )
+
+    @staticmethod
+    def _iter_blob(blob: storage.Blob) -> Iterator[bytes]:
+        """Yield a blob's content in fixed-size chunks."""
+        with blob.open("rb", chunk_size=_DOWNLOAD_CHUNK_SIZE) as reader:
+            while chunk := reader.read(_DOWNLOAD_CHUNK_SIZE):
+                yield chunk
+
+    def download_file(self, user_id: int, filename: str) -> tuple[Iterator[bytes], str]:
         """
         Download file from GCS.
 
+        The content is streamed in chunks rather than read into memory, so
+        large documents cost one buffer per request regardless of size.
+
         Args:
             user_id: User ID
             filename: Filename or path to download (e.g., "profile_photo.jpg" or "grp-2026-4-001/abc123.jpg")
 
         Returns:
-            tuple: (file_content, content_type)
+            tuple: (iterator over file content chunks, content_type)
 
         Raises:
             HTTPException: If download fails or file not found
@@ -275,11 +327,9 @@ class StorageService:
             # Create GCS path
             gcs_path = f"{user_id}/{sanitized_filename}"
 
-            # Get blob
-            blob = self.bucket.blob(gcs_path)
-
-            # Check if exists
-            if not blob.exists():
+            # Fetch blob metadata; None if the file doesn't exist
+            blob = self.bucket.get_blob(gcs_path)
+            if blob is None:
                 raise StandardHTTPException(
                     status_code=status.HTTP_404_NOT_FOUND,
                     message="File not found",
@@ -287,18 +337,16 @@ class StorageService:
                     data=None,
                 )
 
-            # Download content
-            content = blob.download_as_bytes()
             content_type = blob.content_type or "application/octet-stream"
 
-            logger.info(f"Downloaded file for user {user_id}: {gcs_path}")
+            logger.info("Downloaded file for user %s: %s", user_id, gcs_path)
 
-            return content, content_type
+            return self._iter_blob(blob), content_type
 
         except HTTPException:
             raise
         except GoogleCloudError as e:
-            logger.error(f"GCS error downloading file for user {user_id}: {e}")
+            logger.error("GCS error downloading file for user %s: %s", user_id, e)
             raise StandardHTTPException(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
                 message="Failed to download file from cloud storage. Please try again.",
@@ -306,7 +354,7 @@ class StorageService:
                 data=None,
             )
         except Exception as e:
-            logger.error(f"Unexpected error downloading file for user {user_id}: {e}")
+            logger.error("Unexpected error downloading file for user %s: %s", user_id, e)
             raise StandardHTTPException(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
                 message="Failed to download file. Please try again.",
@@ -335,20 +383,17 @@ class StorageService:
             # Create GCS path
             gcs_path = f"{user_id}/{sanitized_filename}"
 
-            # Get blob
-            blob = self.bucket.blob(gcs_path)
-
-            # Delete if exists
-            if blob.exists():
-                blob.delete()
-                logger.info(f"Deleted file for user {user_id}: {gcs_path}")
-                return True
-            else:
-                logger.warning(f"File not found for deletion: {gcs_path}")
-                return False
+            # Delete directly; a missing object comes back as NotFound, which
+            # saves the separate existence check round trip
+            self.bucket.blob(gcs_path).delete()
+            logger.info("Deleted file for user %s: %s", user_id, gcs_path)
+            return True
 
+        except NotFound:
+            logger.warning("File not found for deletion: %s", gcs_path)
+            return False
         except GoogleCloudError as e:
-            logger.error(f"GCS error deleting file for user {user_id}: {e}")
+            logger.error("GCS error deleting file for user %s: %s", user_id, e)
             raise StandardHTTPException(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
                 message="Failed to delete file from cloud storage. Please try again.",
@@ -356,7 +401,7 @@ class StorageService:
                 data=None,
             )
         except Exception as e:
-            logger.error(f"Unexpected error deleting file for user {user_id}: {e}")
+            logger.error("Unexpected error deleting file for user %s: %s", user_id, e)
             raise StandardHTTPException(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
                 message="Failed to delete file. Please try again.",
@@ -404,11 +449,11 @@ class StorageService:
                     }
                 )
 
-            logger.info(f"Listed {len(files)} files for user {user_id}")
+            logger.info("Listed %s files for user %s", len(files), user_id)
             return files
 
         except GoogleCloudError as e:
-            logger.error(f"GCS error listing files for user {user_id}: {e}")
+            logger.error("GCS error listing files for user %s: %s", user_id, e)
             raise StandardHTTPException(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
                 message="Failed to list files from cloud storage. Please try again.",
@@ -416,7 +461,7 @@ class StorageService:
                 data=None,
             )
         except Exception as e:
-            logger.error(f"Unexpected error listing files for user {user_id}: {e}")
+            logger.error("Unexpected error listing files for user %s: %s", user_id, e)
             raise StandardHTTPException(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
                 message="Failed to list files. Please try again.",
@@ -447,5 +492,17 @@ class StorageService:
             return blob.exists()
 
         except Exception as e:
-            logger.error(f"Error checking file existence for user {user_id}: {e}")
+            logger.error("Error checking file existence for user %s: %s", user_id, e)
             return False
+
+
+# Shared instance; the GCS client, credentials and bucket handle are built once
+_storage_service: StorageService | None = None
+
+
+def get_storage_service() -> StorageService:
+    """Return the process-wide StorageService, creating it on first use."""
+    global _storage_service
+    if _storage_service is None:
+        _storage_service = StorageService()
+    return _storage_service
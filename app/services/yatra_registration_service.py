@@ -728,7 +728,7 @@ class YatraRegistrationService:
         Raises:
             StandardHTTPException: If registration not found or access denied
         """
-        from app.services.storage_service import StorageService
+        from app.services.storage_service import get_storage_service
 
         registration = (
             self.db.query(YatraRegistration).filter(YatraRegistration.id == registration_id).first()
@@ -756,7 +756,7 @@ class YatraRegistrationService:
         group_id_lower = group_id.lower()
 
         # List all files for the devotee
-        storage_service = StorageService()
+        storage_service = get_storage_service()
         all_files = storage_service.list_user_files(registration.devotee_id)
 
         # Filter files in the group_id directory (payment screenshots)